@@ -0,0 +1,194 @@
+"""Solve many inputs of one day, loading the solution only once."""
+
+import importlib
+import logging
+import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+
+from advent_of_code.parts import solve_module
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """The outcome of solving one input of a batch.
+
+    Attributes
+    ----------
+    input_file: Path
+        The input that was solved
+    result: tuple[int, int] | None
+        The (part1_result, part2_result) if the solve finished
+    wall_time: float
+        Wall-clock seconds spent solving, not counting reading the input
+    error: str | None
+        The error the solve raised, if any
+    """
+
+    input_file: Path
+    result: tuple[int, int] | None
+    wall_time: float
+    error: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Indicate whether the solve finished without error."""
+        return self.error is None
+
+
+def input_files(input_dir: Path) -> list[Path]:
+    """Get every visible file in a directory of inputs, sorted by name."""
+    return sorted(
+        path
+        for path in input_dir.iterdir()
+        if path.is_file() and not path.name.startswith(".")
+    )
+
+
+@contextmanager
+def _quiet() -> Iterator[None]:
+    """Keep the solution's per-part log lines off the console."""
+    root_logger = logging.getLogger()
+    handlers = root_logger.handlers[:]
+    for handler in handlers:
+        root_logger.removeHandler(handler)
+    try:
+        yield
+    finally:
+        for handler in handlers:
+            root_logger.addHandler(handler)
+
+
+def solve_file(
+    module_name: str, input_file: Path, concurrency: str | None = None
+) -> BatchResult:
+    """Solve one input with an already imported solution module.
+
+    Parameters
+    ----------
+    module_name: str
+        The dotted name of the solution module
+    input_file: Path
+        The input to solve
+    concurrency: str | None
+        How to run the parts at the same time, if the solution has parts
+
+    Returns
+    -------
+    BatchResult
+        The answers and timing of the solve, or its error
+    """
+    module = importlib.import_module(module_name)
+    try:
+        input_data = input_file.read_text().rstrip("\n")
+    except (OSError, UnicodeDecodeError) as exc:
+        # One unreadable input is reported in its row, not fatal to the batch
+        return BatchResult(
+            input_file=input_file,
+            result=None,
+            wall_time=0.0,
+            error=f"{type(exc).__name__}: {exc}",
+        )
+
+    start_time = time.perf_counter()
+    try:
+        with _quiet():
+            result = solve_module(module, input_data, concurrency)
+    except Exception as exc:  # noqa: BLE001
+        return BatchResult(
+            input_file=input_file,
+            result=None,
+            wall_time=time.perf_counter() - start_time,
+            error=f"{type(exc).__name__}: {exc}",
+        )
+    return BatchResult(
+        input_file=input_file,
+        result=(result[0], result[1]),
+        wall_time=time.perf_counter() - start_time,
+    )
+
+
+def run_batch(
+    module_name: str,
+    files: list[Path],
+    max_workers: int | None = None,
+    concurrency: str | None = None,
+) -> list[BatchResult]:
+    """Solve every input, spreading them over a pool of worker processes.
+
+    The solution is imported once per worker rather than once per input, so
+    throughput is bound by the solves themselves. With one worker, every input
+    is solved in this process.
+
+    Parameters
+    ----------
+    module_name: str
+        The dotted name of the solution module
+    files: list[Path]
+        The inputs to solve
+    max_workers: int | None
+        The most worker processes to use, or None for one per CPU
+    concurrency: str | None
+        How to run the parts of each solve at the same time
+
+    Returns
+    -------
+    list[BatchResult]
+        The outcome of each input, in the order given
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(files))
+    solve = partial(solve_file, module_name, concurrency=concurrency)
+    if workers <= 1:
+        return [solve(input_file) for input_file in files]
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=importlib.import_module,
+        initargs=(module_name,),
+    ) as executor:
+        return list(executor.map(solve, files))
+
+
+def format_table(results: list[BatchResult]) -> list[str]:
+    """Lay out the answers and timings of each input as table rows.
+
+    Parameters
+    ----------
+    results: list[BatchResult]
+        The outcome of each input
+
+    Returns
+    -------
+    list[str]
+        The header, a rule and one row per input
+    """
+    rows = [("Input", "Part 1", "Part 2", "Time")]
+    for batch_result in results:
+        if batch_result.result is None:
+            answers = ("error", batch_result.error or "")
+        else:
+            answers = (str(batch_result.result[0]), str(batch_result.result[1]))
+        rows.append(
+            (batch_result.input_file.name, *answers, f"{batch_result.wall_time:.4f}s")
+        )
+
+    widths = [max(len(row[column]) for row in rows) for column in range(4)]
+    lines = [
+        "  ".join(
+            [
+                *(row[column].ljust(widths[column]) for column in range(3)),
+                row[3].rjust(widths[3]),
+            ]
+        )
+        for row in rows
+    ]
+    lines.insert(1, "-" * len(lines[0]))
+    return lines
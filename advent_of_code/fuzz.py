@@ -0,0 +1,400 @@
+"""
+Differential Fuzzing.
+
+Check the optimized solution paths against the frozen reference oracles in
+`advent_of_code.oracles` on random inputs of growing size, and measure the
+speed-up of each optimized path at every size.
+"""
+
+import argparse
+import importlib
+import logging
+import random
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+from types import ModuleType
+
+from advent_of_code import oracles
+from advent_of_code.lib.memo import reset_caches
+
+
+logger = logging.getLogger(__name__)
+
+# Random inputs are generated at each size for every engine
+DEFAULT_TRIALS = 3
+DEFAULT_SEED = 2025
+# Sizes double from the smallest to the largest
+DEFAULT_MIN_SIZE = 8
+DEFAULT_MAX_SIZE = 64
+
+
+@dataclass(frozen=True)
+class Engine:
+    """A reference oracle and the optimized path it checks, for one part of a day.
+
+    Attributes
+    ----------
+    year: int
+        The year of the challenge
+    day: int
+        The day of the challenge
+    part: int
+        The part of the challenge
+    generate: Callable[[random.Random, int], str]
+        Makes a random puzzle input of the given size
+    reference: Callable[[str], int]
+        Solves the part from the input with a frozen reference oracle
+    optimized: Callable[[str], int]
+        Solves the part from the input with the solution's current path
+    """
+
+    year: int
+    day: int
+    part: int
+    generate: Callable[[random.Random, int], str]
+    reference: Callable[[str], int]
+    optimized: Callable[[str], int]
+
+    @property
+    def name(self) -> str:
+        """Get a readable name for the engine."""
+        return f"{self.year} Day {self.day} Part {self.part}"
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """The outcome of the reference and optimized paths on one input.
+
+    Attributes
+    ----------
+    size: int
+        The size the input was generated at
+    trial: int
+        Which of the random inputs at this size it was
+    reference: int
+        The answer of the reference oracle
+    optimized: int
+        The answer of the optimized path
+    reference_time: float
+        Seconds the reference oracle took
+    optimized_time: float
+        Seconds the optimized path took
+    """
+
+    size: int
+    trial: int
+    reference: int
+    optimized: int
+    reference_time: float
+    optimized_time: float
+
+    @property
+    def matched(self) -> bool:
+        """Indicate whether both paths gave the same answer."""
+        return self.reference == self.optimized
+
+
+def _solution(year: int, day: int) -> ModuleType:
+    """Import a solution module."""
+    return importlib.import_module(f"advent_of_code.year_{year}.day_{day:02d}.solution")
+
+
+def _optimized(year: int, day: int, part: int) -> Callable[[str], int]:
+    """Solve a part by parsing the input and running the solution's part function."""
+
+    def solve_part(input_data: str) -> int:
+        module = _solution(year, day)
+        return getattr(module, f"part{part}")(module.parse(input_data))
+
+    return solve_part
+
+
+def generate_rotations(rng: random.Random, size: int) -> str:
+    """Make `size` dial rotations of up to almost ten whole turns.
+
+    Half of the inputs only turn in multiples of ten, so the dial often stops at 0.
+    """
+    step = rng.choice([1, 10])
+    return "\n".join(
+        f"{rng.choice('LR')}{step * rng.randint(1, 999 // step)}" for _ in range(size)
+    )
+
+
+def generate_id_ranges(rng: random.Random, size: int) -> str:
+    """Make `size` ID ranges, half of which cross from one ID length to the next.
+
+    Ranges span at most a thousand IDs, so the oracle can check every one.
+    """
+    id_ranges = []
+    for _ in range(size):
+        span = rng.randint(0, 10 ** rng.randint(1, 3))
+        if rng.random() < 0.5:  # noqa: PLR2004
+            start_id = max(1, 10 ** rng.randint(1, 10) - rng.randint(0, span))
+        else:
+            start_id = rng.randint(1, 10 ** rng.randint(1, 10))
+        id_ranges.append(f"{start_id}-{start_id + span}")
+    return ",".join(id_ranges)
+
+
+def generate_banks(rng: random.Random, size: int) -> str:
+    """Make `size` banks of 100 batteries, with capacities from 1 to 9."""
+    return "\n".join(
+        "".join(rng.choice("123456789") for _ in range(100)) for _ in range(size)
+    )
+
+
+def generate_rolls(rng: random.Random, size: int) -> str:
+    """Make a `size` by `size` grid that is about two-thirds rolls of paper."""
+    return "\n".join(
+        "".join("@" if rng.random() < 2 / 3 else "." for _ in range(size))
+        for _ in range(size)
+    )
+
+
+# Each optimized path, paired with the original implementation it replaced
+ENGINES = [
+    Engine(
+        year=2025,
+        day=1,
+        part=1,
+        generate=generate_rotations,
+        reference=oracles.dial_stops,
+        optimized=_optimized(2025, 1, 1),
+    ),
+    Engine(
+        year=2025,
+        day=1,
+        part=2,
+        generate=generate_rotations,
+        reference=oracles.dial_clicks,
+        optimized=_optimized(2025, 1, 2),
+    ),
+    Engine(
+        year=2025,
+        day=2,
+        part=1,
+        generate=generate_id_ranges,
+        reference=partial(oracles.invalid_id_sum, part=1),
+        optimized=_optimized(2025, 2, 1),
+    ),
+    Engine(
+        year=2025,
+        day=2,
+        part=2,
+        generate=generate_id_ranges,
+        reference=partial(oracles.invalid_id_sum, part=2),
+        optimized=_optimized(2025, 2, 2),
+    ),
+    Engine(
+        year=2025,
+        day=3,
+        part=1,
+        generate=generate_banks,
+        reference=partial(oracles.max_joltage_sum, num_batteries=2),
+        optimized=_optimized(2025, 3, 1),
+    ),
+    Engine(
+        year=2025,
+        day=3,
+        part=2,
+        generate=generate_banks,
+        reference=partial(oracles.max_joltage_sum, num_batteries=12),
+        optimized=_optimized(2025, 3, 2),
+    ),
+    Engine(
+        year=2025,
+        day=4,
+        part=1,
+        generate=generate_rolls,
+        reference=oracles.movable_rolls,
+        optimized=_optimized(2025, 4, 1),
+    ),
+    Engine(
+        year=2025,
+        day=4,
+        part=2,
+        generate=generate_rolls,
+        reference=oracles.removable_rolls,
+        optimized=_optimized(2025, 4, 2),
+    ),
+]
+
+
+def _timed(solve_part: Callable[[str], int], input_data: str) -> tuple[int, float]:
+    """Run a path from cold caches and measure its wall time."""
+    reset_caches()
+    start_time = time.perf_counter()
+    result = solve_part(input_data)
+    return result, time.perf_counter() - start_time
+
+
+def compare(engine: Engine, size: int, trial: int, seed: int) -> Comparison:
+    """Run both paths of an engine on one random input.
+
+    The input depends only on the seed, engine, size and trial, so a mismatch
+    can be reproduced from what is logged.
+
+    Parameters
+    ----------
+    engine: Engine
+        The reference and optimized paths to compare
+    size: int
+        The size of the input to generate
+    trial: int
+        Which random input at this size to generate
+    seed: int
+        The seed of the run
+
+    Returns
+    -------
+    Comparison
+        Both answers and both timings
+    """
+    rng = random.Random(f"{seed}:{engine.name}:{size}:{trial}")  # noqa: S311
+    input_data = engine.generate(rng, size)
+    reference, reference_time = _timed(engine.reference, input_data)
+    optimized, optimized_time = _timed(engine.optimized, input_data)
+    return Comparison(size, trial, reference, optimized, reference_time, optimized_time)
+
+
+def sizes_between(min_size: int, max_size: int) -> list[int]:
+    """Get the sizes from the smallest to the largest, doubling each time."""
+    if min_size < 1 or max_size < min_size:
+        msg = f"Expected 1 <= min size <= max size. Got {min_size} and {max_size}."
+        raise ValueError(msg)
+    sizes = [min_size]
+    while sizes[-1] * 2 <= max_size:
+        sizes.append(sizes[-1] * 2)
+    return sizes
+
+
+def fuzz_engine(
+    engine: Engine, sizes: list[int], trials: int, seed: int
+) -> list[Comparison]:
+    """Compare an engine's paths at every size and log the speed-up at each.
+
+    Parameters
+    ----------
+    engine: Engine
+        The reference and optimized paths to compare
+    sizes: list[int]
+        The sizes to generate inputs at
+    trials: int
+        The number of random inputs at each size
+    seed: int
+        The seed of the run
+
+    Returns
+    -------
+    list[Comparison]
+        The comparisons that did not match
+    """
+    mismatches: list[Comparison] = []
+    for size in sizes:
+        comparisons = [compare(engine, size, trial, seed) for trial in range(trials)]
+        mismatches.extend(c for c in comparisons if not c.matched)
+        reference_time = min(c.reference_time for c in comparisons)
+        optimized_time = min(c.optimized_time for c in comparisons)
+        logger.info(
+            "%s, size %5d: reference %.4fs, optimized %.4fs, %.1fx%s",
+            engine.name,
+            size,
+            reference_time,
+            optimized_time,
+            reference_time / optimized_time if optimized_time else float("inf"),
+            "" if all(c.matched for c in comparisons) else " MISMATCH",
+        )
+    return mismatches
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the differential fuzzing."""
+    parser = argparse.ArgumentParser(
+        prog="aoc fuzz",
+        description="Check optimized paths against reference oracles on random inputs",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s                             # Fuzz every engine from size 8 to 64
+  %(prog)s --day 4 --max-size 1024     # Scale 2025 Day 4 up to a 1024x1024 grid
+  %(prog)s --seed 7 --trials 10        # More inputs per size, with another seed
+        """.strip(),
+    )
+    parser.add_argument("--year", type=int, help="Only fuzz the engines of this year")
+    parser.add_argument(
+        "--day", type=int, action="append", help="Only fuzz the engines of this day"
+    )
+    parser.add_argument(
+        "--min-size",
+        type=int,
+        default=DEFAULT_MIN_SIZE,
+        help=f"Smallest input size (default: {DEFAULT_MIN_SIZE})",
+    )
+    parser.add_argument(
+        "--max-size",
+        type=int,
+        default=DEFAULT_MAX_SIZE,
+        help=f"Largest input size (default: {DEFAULT_MAX_SIZE})",
+    )
+    parser.add_argument(
+        "--trials",
+        type=int,
+        default=DEFAULT_TRIALS,
+        help=f"Random inputs per size (default: {DEFAULT_TRIALS})",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=DEFAULT_SEED,
+        help=f"Seed for the random inputs (default: {DEFAULT_SEED})",
+    )
+
+    args = parser.parse_args(argv)
+
+    # Set up logging
+    logging.basicConfig(
+        level=logging.INFO, format="%(message)s", handlers=[logging.StreamHandler()]
+    )
+
+    try:
+        sizes = sizes_between(args.min_size, args.max_size)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    engines = [
+        engine
+        for engine in ENGINES
+        if (args.year is None or engine.year == args.year)
+        and (args.day is None or engine.day in args.day)
+    ]
+    if not engines:
+        logger.error("No engines match the given year and day")
+        sys.exit(1)
+
+    mismatches: list[tuple[Engine, Comparison]] = []
+    for engine in engines:
+        mismatches.extend(
+            (engine, comparison)
+            for comparison in fuzz_engine(engine, sizes, args.trials, args.seed)
+        )
+
+    for engine, comparison in mismatches:
+        logger.error(
+            "Mismatch: %s, size %d, trial %d (seed %d): reference %d, optimized %d",
+            engine.name,
+            comparison.size,
+            comparison.trial,
+            args.seed,
+            comparison.reference,
+            comparison.optimized,
+        )
+    if mismatches:
+        sys.exit(1)
+    logger.info("All %d engines matched their reference", len(engines))
+
+
+if __name__ == "__main__":
+    main()
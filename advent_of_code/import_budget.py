@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Import-Time Budget Check.
+
+Measure how long modules take to import in a fresh interpreter using
+`python -X importtime`, and fail if any of them exceeds its budget.
+"""
+
+import argparse
+import logging
+import subprocess
+import sys
+
+
+logger = logging.getLogger(__name__)
+
+# The runner should start in well under this many seconds before any solution loads
+DEFAULT_BUDGET = 0.05
+DEFAULT_MODULES = ["advent_of_code.runner"]
+
+
+def measure_import_time(module_name: str) -> float:
+    """Measure the cold, cumulative import time of a module.
+
+    Parameters
+    ----------
+    module_name: str
+        The dotted name of the module to import
+
+    Returns
+    -------
+    float
+        The import time in seconds, including everything the module imports
+    """
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines look like "import time: self [us] | cumulative | imported package"
+    for line in reversed(result.stderr.splitlines()):
+        _, _, fields = line.partition("import time:")
+        parts = [part.strip() for part in fields.split("|")]
+        if len(parts) == 3 and parts[2] == module_name:  # noqa: PLR2004
+            return int(parts[1]) / 1_000_000
+
+    msg = f"No import time reported for {module_name}."
+    raise RuntimeError(msg)
+
+
+def check_import_budget(
+    module_names: list[str], budget: float = DEFAULT_BUDGET, repeat: int = 3
+) -> bool:
+    """Check that each module imports within the budget.
+
+    Parameters
+    ----------
+    module_names: list[str]
+        The dotted names of the modules to check
+    budget: float
+        The maximum import time in seconds
+    repeat: int
+        The number of cold imports to time, keeping the fastest to reduce noise
+
+    Returns
+    -------
+    bool
+        Whether every module is within the budget
+    """
+    within_budget = True
+    for module_name in module_names:
+        import_time = min(measure_import_time(module_name) for _ in range(repeat))
+        if import_time > budget:
+            within_budget = False
+            logger.error(
+                "%s: %.4fs exceeds the %.4fs budget", module_name, import_time, budget
+            )
+        else:
+            logger.info("%s: %.4fs (budget %.4fs)", module_name, import_time, budget)
+    return within_budget
+
+
+def main() -> None:
+    """Run the import-time budget check."""
+    parser = argparse.ArgumentParser(
+        description="Fail if a module takes longer than a budget to import",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s                                  # Check the runner
+  %(prog)s --budget 0.1                     # Check the runner against 100ms
+  %(prog)s advent_of_code.year_2025.day_03.solution --budget 0.02
+        """.strip(),
+    )
+    parser.add_argument(
+        "modules",
+        nargs="*",
+        default=DEFAULT_MODULES,
+        help="Modules to check (default: the runner)",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=DEFAULT_BUDGET,
+        help=f"Maximum import time in seconds (default: {DEFAULT_BUDGET})",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Number of cold imports to time, keeping the fastest (default: 3)",
+    )
+
+    args = parser.parse_args()
+
+    # Set up logging
+    logging.basicConfig(
+        level=logging.INFO, format="%(message)s", handlers=[logging.StreamHandler()]
+    )
+
+    if not check_import_budget(args.modules, budget=args.budget, repeat=args.repeat):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
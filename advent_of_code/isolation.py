@@ -0,0 +1,273 @@
+"""Run solutions in child processes with time and memory limits."""
+
+import contextlib
+import importlib
+import logging
+import multiprocessing
+import os
+import resource
+import signal
+import time
+import traceback
+from dataclasses import dataclass, field
+from enum import StrEnum
+from pathlib import Path
+from types import FrameType
+from typing import TYPE_CHECKING
+
+from advent_of_code.lib.jit import kernel_backends
+from advent_of_code.lib.memo import CacheStats, cache_stats
+from advent_of_code.parts import solve_module
+from advent_of_code.timings import PartTiming, peak_rss, record_part_timings
+
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+
+
+logger = logging.getLogger(__name__)
+
+
+class RunStatus(StrEnum):
+    """How an isolated solve ended."""
+
+    OK = "ok"
+    TIMEOUT = "timeout"
+    OUT_OF_MEMORY = "out of memory"
+    CPU_LIMIT = "cpu limit"
+    ERROR = "error"
+    CRASHED = "crashed"
+
+
+@dataclass(frozen=True)
+class ResourceLimits:
+    """Limits applied to a single isolated solve.
+
+    Attributes
+    ----------
+    timeout: float | None
+        Wall-clock seconds before the child is killed
+    memory: int | None
+        Bytes of address space the child may map (RLIMIT_AS)
+    cpu_time: int | None
+        CPU seconds the child may use (RLIMIT_CPU)
+    """
+
+    timeout: float | None = None
+    memory: int | None = None
+    cpu_time: int | None = None
+
+
+@dataclass(frozen=True)
+class IsolatedRun:
+    """The outcome of an isolated solve.
+
+    Attributes
+    ----------
+    status: RunStatus
+        How the solve ended
+    result: tuple[int, int] | None
+        The (part1_result, part2_result) if the solve finished
+    wall_time: float
+        Wall-clock seconds spent solving, or until the child was stopped
+    peak_rss: int | None
+        Peak resident set size of the child in bytes, if it could be measured
+    error: str | None
+        A description of what went wrong, if anything
+    part_timings: list[PartTiming]
+        The answers and timings the solution logged for each part
+    cache_stats: list[CacheStats]
+        The counters of the memoized helpers the solve called
+    kernel_backends: dict[str, str]
+        The backend each kernel the solve called ran on
+    """
+
+    status: RunStatus
+    result: tuple[int, int] | None
+    wall_time: float
+    peak_rss: int | None
+    error: str | None = None
+    part_timings: list[PartTiming] = field(default_factory=list)
+    cache_stats: list[CacheStats] = field(default_factory=list)
+    kernel_backends: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def succeeded(self) -> bool:
+        """Indicate whether the solve finished without error."""
+        return self.status == RunStatus.OK
+
+
+class CPULimitExceededError(Exception):
+    """Raised in the child when it reaches its CPU-time limit."""
+
+
+def _raise_cpu_limit(_signum: int, _frame: FrameType | None) -> None:
+    """Turn SIGXCPU into an exception so the child can report it."""
+    raise CPULimitExceededError
+
+
+def _peak_rss_of(pid: int) -> int | None:
+    """Read the peak resident set size of a running process, where supported."""
+    status_file = Path(f"/proc/{pid}/status")
+    try:
+        for line in status_file.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def _apply_limits(limits: ResourceLimits) -> None:
+    """Apply the memory and CPU limits to the current process."""
+    if limits.memory is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (limits.memory, limits.memory))
+    if limits.cpu_time is not None:
+        signal.signal(signal.SIGXCPU, _raise_cpu_limit)
+        # The hard limit kills the child outright if it ignores the soft one
+        resource.setrlimit(resource.RLIMIT_CPU, (limits.cpu_time, limits.cpu_time + 1))
+
+
+def _solve_in_child(
+    module_name: str,
+    input_data: str,
+    limits: ResourceLimits,
+    concurrency: str | None,
+    conn: "Connection",
+) -> None:
+    """Import and run a solution, then send back how it went."""
+    # Lead a process group of our own, so the runner can kill any processes the
+    # solution starts along with us
+    os.setsid()
+    logging.basicConfig(
+        level=logging.INFO, format="%(message)s", handlers=[logging.StreamHandler()]
+    )
+    _apply_limits(limits)
+
+    result = None
+    error = None
+    start_time = time.perf_counter()
+    try:
+        module = importlib.import_module(module_name)
+        with record_part_timings() as recorder:
+            result = solve_module(module, input_data, concurrency)
+        status = RunStatus.OK
+    except MemoryError:
+        status = RunStatus.OUT_OF_MEMORY
+        error = "MemoryError"
+    except CPULimitExceededError:
+        status = RunStatus.CPU_LIMIT
+        error = f"Exceeded {limits.cpu_time}s of CPU time"
+    except Exception:  # noqa: BLE001
+        status = RunStatus.ERROR
+        error = traceback.format_exc()
+    wall_time = time.perf_counter() - start_time
+
+    succeeded = status == RunStatus.OK
+    conn.send(
+        IsolatedRun(
+            status=status,
+            result=(result[0], result[1]) if result is not None else None,
+            wall_time=wall_time,
+            peak_rss=peak_rss(),
+            error=error,
+            part_timings=recorder.timings if succeeded else [],
+            cache_stats=cache_stats(),
+            kernel_backends=kernel_backends(),
+        )
+    )
+    conn.close()
+
+
+def _kill_process_group(process: "BaseProcess") -> None:
+    """Kill the child and every process it started, such as a solution's pool."""
+    # Nothing may be left in the group, or the child may not have started it yet
+    with contextlib.suppress(ProcessLookupError):
+        os.killpg(process.pid, signal.SIGKILL)  # type: ignore[arg-type]
+    process.kill()
+
+
+def run_isolated(
+    module_name: str,
+    input_data: str,
+    limits: ResourceLimits,
+    concurrency: str | None = None,
+) -> IsolatedRun:
+    """Run a solution in a fresh child process under resource limits.
+
+    The child is started with the "spawn" method so that it shares no state with
+    the runner, and leads its own process group. A child that runs past its
+    timeout is killed, and one that dies without reporting back is classified from
+    its exit code. Either way, every process left in its group is killed too.
+
+    Parameters
+    ----------
+    module_name: str
+        The dotted name of the solution module
+    input_data: str
+        The input data to pass to `solve`
+    limits: ResourceLimits
+        The limits to apply to the child
+    concurrency: str | None
+        How to run the parts at the same time, if the solution has parts
+
+    Returns
+    -------
+    IsolatedRun
+        The status, answers, timing and peak memory of the solve
+    """
+    context = multiprocessing.get_context("spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_solve_in_child,
+        args=(module_name, input_data, limits, concurrency, sender),
+        # Not a daemon, so solutions can start process pools of their own
+        daemon=False,
+    )
+
+    start_time = time.perf_counter()
+    process.start()
+    sender.close()
+
+    try:
+        reported = receiver.poll(limits.timeout)
+    except BaseException:
+        # The child is not in our process group, so it would miss a Ctrl-C
+        _kill_process_group(process)
+        process.join()
+        raise
+
+    if not reported:
+        rss = _peak_rss_of(process.pid) if process.pid else None
+        _kill_process_group(process)
+        process.join()
+        return IsolatedRun(
+            status=RunStatus.TIMEOUT,
+            result=None,
+            wall_time=time.perf_counter() - start_time,
+            peak_rss=rss,
+            error=f"Exceeded {limits.timeout}s of wall-clock time",
+        )
+
+    try:
+        run: IsolatedRun = receiver.recv()
+    except EOFError:
+        # The child died before it could report, e.g. from a signal
+        _kill_process_group(process)
+        process.join()
+        status = (
+            RunStatus.CPU_LIMIT
+            if process.exitcode == -signal.SIGXCPU
+            else RunStatus.CRASHED
+        )
+        return IsolatedRun(
+            status=status,
+            result=None,
+            wall_time=time.perf_counter() - start_time,
+            peak_rss=None,
+            error=f"Child exited with code {process.exitcode}",
+        )
+
+    process.join()
+    return run
@@ -0,0 +1,59 @@
+# Shared parsing and data structure primitives for solutions
+#
+# Names are resolved on first access, so a solution only pays for the submodules
+# (and NumPy) it actually uses.
+import importlib
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from advent_of_code.lib.grid import Grid, neighbour_counts
+    from advent_of_code.lib.intervals import IntervalSet
+    from advent_of_code.lib.jit import kernel, kernel_backends, reset_kernels
+    from advent_of_code.lib.memo import (
+        CacheStats,
+        cache_stats,
+        memoize,
+        reset_caches,
+    )
+    from advent_of_code.lib.parsing import extract_ints, split_lines
+
+_EXPORTS = {
+    "Grid": "advent_of_code.lib.grid",
+    "neighbour_counts": "advent_of_code.lib.grid",
+    "IntervalSet": "advent_of_code.lib.intervals",
+    "kernel": "advent_of_code.lib.jit",
+    "kernel_backends": "advent_of_code.lib.jit",
+    "reset_kernels": "advent_of_code.lib.jit",
+    "CacheStats": "advent_of_code.lib.memo",
+    "cache_stats": "advent_of_code.lib.memo",
+    "memoize": "advent_of_code.lib.memo",
+    "reset_caches": "advent_of_code.lib.memo",
+    "extract_ints": "advent_of_code.lib.parsing",
+    "split_lines": "advent_of_code.lib.parsing",
+}
+
+__all__ = [
+    "CacheStats",
+    "Grid",
+    "IntervalSet",
+    "cache_stats",
+    "extract_ints",
+    "kernel",
+    "kernel_backends",
+    "memoize",
+    "neighbour_counts",
+    "reset_caches",
+    "reset_kernels",
+    "split_lines",
+]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import an exported name from its submodule on first access."""
+    if name not in _EXPORTS:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
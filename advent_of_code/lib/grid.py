@@ -0,0 +1,80 @@
+"""A 2-D character grid backed by NumPy."""
+
+import numpy as np
+
+
+ZERO = ord("0")
+
+
+def neighbour_counts(mask: np.ndarray, diagonal: bool = True) -> np.ndarray:
+    """Count the set neighbours of every cell in a boolean mask.
+
+    The mask is zero-padded and its shifted copies summed, which applies a 3x3
+    neighbour kernel to the whole grid at once.
+
+    Parameters
+    ----------
+    mask: np.ndarray
+        A 2-D boolean array
+    diagonal: bool
+        Whether to count the four diagonal neighbours as well as the four
+        orthogonal ones
+
+    Returns
+    -------
+    np.ndarray
+        A 2-D int array with the number of set neighbours of each cell
+    """
+    rows, cols = mask.shape
+    padded = np.pad(mask.astype(np.int8), 1)
+    counts = np.zeros((rows, cols), dtype=np.int8)
+    for di in (-1, 0, 1):
+        for dj in (-1, 0, 1):
+            if (di, dj) == (0, 0) or (not diagonal and di and dj):
+                continue
+            counts += padded[1 + di : 1 + di + rows, 1 + dj : 1 + dj + cols]
+    return counts
+
+
+class Grid:
+    """A 2-D character grid stored as a uint8 array of ASCII codes."""
+
+    def __init__(self, cells: np.ndarray) -> None:
+        """Wrap a 2-D uint8 array of ASCII codes."""
+        self.cells = cells
+
+    @classmethod
+    def from_lines(cls, lines: list[str], fill: str = " ") -> "Grid":
+        """Load a grid from its lines, padding short lines with `fill`."""
+        width = max((len(line) for line in lines), default=0)
+        text = "".join(line.ljust(width, fill) for line in lines)
+        cells = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+        return cls(cells.reshape(len(lines), width))
+
+    @classmethod
+    def from_text(cls, input_data: str, fill: str = " ") -> "Grid":
+        """Load a grid from text, ignoring surrounding blank lines."""
+        return cls.from_lines(input_data.strip("\n").split("\n"), fill=fill)
+
+    def __repr__(self) -> str:
+        """Print out the dimensions of the grid."""
+        rows, cols = self.shape
+        return f"Grid(rows={rows}, cols={cols})"
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Get the (rows, cols) of the grid."""
+        rows, cols = self.cells.shape
+        return rows, cols
+
+    def mask(self, char: str) -> np.ndarray:
+        """Get a boolean mask of the cells holding the given character."""
+        return self.cells == ord(char)
+
+    def digits(self) -> np.ndarray:
+        """Get the grid as single-digit integers."""
+        return (self.cells - ZERO).astype(np.int64)
+
+    def neighbour_counts(self, char: str, diagonal: bool = True) -> np.ndarray:
+        """Count the neighbours of every cell that hold the given character."""
+        return neighbour_counts(self.mask(char), diagonal=diagonal)
@@ -0,0 +1,90 @@
+"""A set of integers stored as merged, inclusive intervals."""
+
+import numpy as np
+
+
+class IntervalSet:
+    """A set of integers stored as sorted, disjoint, inclusive intervals.
+
+    Overlapping, nested and adjacent intervals are merged on construction with
+    one sort and a vectorized sweep that keeps the running maximum end, so a
+    range nested inside an earlier one can never shrink the union.
+    """
+
+    def __init__(self, starts: np.ndarray, ends: np.ndarray) -> None:
+        """Merge the inclusive intervals [starts[i], ends[i]].
+
+        Parameters
+        ----------
+        starts: np.ndarray
+            The first integer of each interval
+        ends: np.ndarray
+            The last integer of each interval
+        """
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = np.asarray(ends, dtype=np.int64)
+        if starts.shape != ends.shape:
+            msg = (
+                "Expected matching starts and ends. "
+                f"Got {starts.shape} and {ends.shape}."
+            )
+            raise ValueError(msg)
+        if np.any(ends < starts):
+            msg = "Expected every interval to end at or after its start."
+            raise ValueError(msg)
+
+        order = np.argsort(starts, kind="stable")
+        starts = starts[order]
+        running_end = np.maximum.accumulate(ends[order])
+
+        # A new interval begins wherever a start clears everything before it
+        is_new = np.ones(len(starts), dtype=bool)
+        is_new[1:] = starts[1:] > running_end[:-1] + 1
+        new_indices = np.flatnonzero(is_new)
+
+        # Each interval ends just before the next one begins
+        last_indices = np.append(new_indices[1:], len(starts)) - 1
+        self.starts = starts[new_indices]
+        self.ends = running_end[last_indices] if len(starts) else running_end
+
+    @classmethod
+    def from_pairs(cls, pairs: np.ndarray) -> "IntervalSet":
+        """Build the set from an (N, 2) array of (start, end) rows."""
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        return cls(pairs[:, 0], pairs[:, 1])
+
+    def __repr__(self) -> str:
+        """Print out the number of merged intervals."""
+        return f"IntervalSet(intervals={len(self.starts)}, size={len(self)})"
+
+    def __len__(self) -> int:
+        """Get the number of integers in the set."""
+        return int((self.ends - self.starts + 1).sum())
+
+    def __contains__(self, value: int) -> bool:
+        """Indicate whether or not a given integer is in the set."""
+        return bool(self.contains(np.array([value]))[0])
+
+    def contains(self, values: np.ndarray) -> np.ndarray:
+        """Check many integers for membership at once.
+
+        Parameters
+        ----------
+        values: np.ndarray
+            The integers to look up
+
+        Returns
+        -------
+        np.ndarray
+            A boolean array, True where the value is in the set
+        """
+        values = np.asarray(values, dtype=np.int64)
+        # Find the last interval starting at or before each value
+        positions = np.searchsorted(self.starts, values, side="right") - 1
+        ends = self.ends[np.maximum(positions, 0)] if len(self.ends) else values - 1
+        return (positions >= 0) & (values <= ends)
+
+    @property
+    def intervals(self) -> list[tuple[int, int]]:
+        """Get the merged (start, end) intervals in ascending order."""
+        return list(zip(self.starts.tolist(), self.ends.tolist(), strict=True))
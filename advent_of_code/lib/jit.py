@@ -0,0 +1,174 @@
+"""Optional JIT compilation of sequential hot loops, with a pure-Python fallback.
+
+Kernels are compiled with Numba only when ``AOC_JIT=1`` is in the environment
+(or the runner is given ``--jit``) and Numba is installed (``uv sync --extra jit``).
+Otherwise they run on the fallback, so Numba is never a hard dependency, and short
+runs don't pay for importing Numba and compiling.
+"""
+
+import functools
+import logging
+import os
+from collections.abc import Callable
+from types import ModuleType
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+# Set to one of these to compile the kernels with Numba
+JIT_ENV = "AOC_JIT"
+ENABLED_VALUES = ("1", "true", "yes", "on")
+
+NUMBA_BACKEND = "numba"
+PYTHON_BACKEND = "python"
+
+_KERNELS: list["Kernel"] = []
+# The backends kernels ran on in other processes, such as process pool workers
+_WORKER_BACKENDS: dict[str, str] = {}
+
+
+@functools.cache
+def _numba() -> ModuleType | None:
+    """Import Numba, if it is enabled and installed."""
+    if os.environ.get(JIT_ENV, "").lower() not in ENABLED_VALUES:
+        return None
+    try:
+        # Numba takes a while to import, so only pay for it when a kernel runs
+        import numba  # noqa: PLC0415
+    except ImportError:
+        return None
+    return numba
+
+
+def _to_array(value: object) -> object:
+    """Turn lists into arrays, which compiled kernels take without reflection."""
+    if not isinstance(value, list):
+        return value
+    # Only compiled kernels need NumPy, and Numba imports it anyway
+    import numpy as np  # noqa: PLC0415
+
+    return np.asarray(value)
+
+
+def _to_python(value: object) -> object:
+    """Turn arrays into lists, which the interpreter indexes much faster."""
+    tolist = getattr(value, "tolist", None)
+    return tolist() if callable(tolist) else value
+
+
+class Kernel:
+    """A hot loop that is JIT-compiled when possible.
+
+    The kernel is compiled in nopython mode on its first call. If Numba is not
+    available, or cannot compile it, the fallback runs instead. With no explicit
+    fallback, the kernel itself is interpreted, with its array arguments turned
+    into lists first, so it must index them as ``a[i][j]`` rather than ``a[i, j]``.
+    List arguments are turned into arrays for the compiled kernel, so a solution
+    that never needs NumPy can pass lists and leave it unimported.
+    """
+
+    def __init__(
+        self, func: Callable[..., Any], fallback: Callable[..., Any] | None = None
+    ) -> None:
+        """Wrap the kernel and its fallback."""
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.fallback = fallback
+        self.name = f"{func.__module__}.{func.__qualname__}"
+        self.calls = 0
+        self._compiled: Callable[..., Any] | None = None
+        self._backend: str | None = None
+
+    @property
+    def backend(self) -> str:
+        """Get the backend the kernel runs on, compiling it if needed."""
+        if self._backend is None:
+            numba = _numba()
+            if numba is None:
+                self._backend = PYTHON_BACKEND
+            else:
+                self._compiled = numba.njit(cache=True)(self.func)
+                self._backend = NUMBA_BACKEND
+        return self._backend
+
+    def _fall_back(self, *args: object) -> Any:  # noqa: ANN401
+        """Run the fallback, or interpret the kernel itself."""
+        if self.fallback is not None:
+            return self.fallback(*args)
+        return self.func(*(_to_python(arg) for arg in args))
+
+    def __call__(self, *args: object) -> Any:  # noqa: ANN401
+        """Run the kernel on the best available backend."""
+        self.calls += 1
+        if self.backend == PYTHON_BACKEND:
+            return self._fall_back(*args)
+
+        numba = _numba()
+        try:
+            return self._compiled(*(_to_array(arg) for arg in args))  # type: ignore[misc]
+        except numba.core.errors.NumbaError:  # type: ignore[union-attr]
+            logger.warning("Could not compile %s, so it runs on Python", self.name)
+            self._backend = PYTHON_BACKEND
+            return self._fall_back(*args)
+
+
+def kernel(
+    fallback: Callable[..., Any] | None = None,
+) -> Callable[[Callable[..., Any]], Kernel]:
+    """Mark a sequential hot loop to be JIT-compiled when Numba is enabled.
+
+    Parameters
+    ----------
+    fallback: Callable[..., Any] | None
+        A function with the same signature to run when the kernel is not compiled,
+        e.g. a vectorized NumPy version. By default the kernel is interpreted.
+
+    Returns
+    -------
+    Callable[[Callable[..., Any]], Kernel]
+        A decorator that turns the function into a kernel
+    """
+
+    def decorator(func: Callable[..., Any]) -> Kernel:
+        wrapped = Kernel(func, fallback)
+        _KERNELS.append(wrapped)
+        return wrapped
+
+    return decorator
+
+
+def reset_kernels() -> None:
+    """Zero the call counters of every kernel."""
+    for wrapped in _KERNELS:
+        wrapped.calls = 0
+    _WORKER_BACKENDS.clear()
+
+
+def add_worker_backends(backends: dict[str, str]) -> None:
+    """Record the backends kernels ran on in another process.
+
+    Parameters
+    ----------
+    backends: dict[str, str]
+        The `kernel_backends` of the other process
+    """
+    _WORKER_BACKENDS.update(backends)
+
+
+def kernel_backends() -> dict[str, str]:
+    """Get the backend of every kernel that has been called.
+
+    Kernels called in other processes are included once their backends have been
+    added with `add_worker_backends`.
+
+    Returns
+    -------
+    dict[str, str]
+        The backend of each kernel, by its dotted name
+    """
+    backends = dict(_WORKER_BACKENDS)
+    backends.update(
+        (wrapped.name, wrapped.backend) for wrapped in _KERNELS if wrapped.calls
+    )
+    return backends
@@ -0,0 +1,107 @@
+"""Bounded memoization for hot solution helpers, with hit and miss counters."""
+
+import functools
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, ParamSpec, TypeVar
+
+
+# How many results a memoized helper keeps before evicting the least recent one
+DEFAULT_MAXSIZE = 4096
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_MEMOIZED: list["functools._lru_cache_wrapper[Any]"] = []
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """The counters of one memoized helper since its cache was last reset.
+
+    Attributes
+    ----------
+    name: str
+        The dotted name of the helper
+    hits: int
+        Calls answered from the cache
+    misses: int
+        Calls that had to run the helper
+    size: int
+        Results currently held in the cache
+    maxsize: int
+        Results the cache holds before it starts evicting
+    """
+
+    name: str
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the fraction of calls answered from the cache."""
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+
+def memoize(
+    maxsize: int = DEFAULT_MAXSIZE,
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Cache a helper's results in a least-recently-used cache of bounded size.
+
+    The helper's arguments must be hashable. Every memoized helper is registered,
+    so `reset_caches` and `cache_stats` cover all of them at once.
+
+    Parameters
+    ----------
+    maxsize: int
+        The number of results to keep before evicting the least recently used one
+
+    Returns
+    -------
+    Callable[[Callable[P, R]], Callable[P, R]]
+        A decorator that memoizes the helper
+    """
+    if maxsize < 1:
+        msg = f"Expected a positive cache size. Got {maxsize}."
+        raise ValueError(msg)
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        cached = functools.lru_cache(maxsize=maxsize)(func)
+        _MEMOIZED.append(cached)
+        return cached  # type: ignore[return-value]
+
+    return decorator
+
+
+def reset_caches() -> None:
+    """Empty every memoized helper's cache and zero its counters."""
+    for cached in _MEMOIZED:
+        cached.cache_clear()
+
+
+def cache_stats() -> list[CacheStats]:
+    """Get the counters of every memoized helper that has been called.
+
+    Returns
+    -------
+    list[CacheStats]
+        The counters, in the order the helpers were defined
+    """
+    stats = []
+    for cached in _MEMOIZED:
+        info = cached.cache_info()
+        if info.hits + info.misses == 0:
+            continue
+        stats.append(
+            CacheStats(
+                name=f"{cached.__module__}.{cached.__qualname__}",
+                hits=info.hits,
+                misses=info.misses,
+                size=info.currsize,
+                maxsize=info.maxsize or 0,
+            )
+        )
+    return stats
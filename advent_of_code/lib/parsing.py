@@ -0,0 +1,54 @@
+"""Fast text parsing helpers shared by solutions."""
+
+import re
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+UNSIGNED_INT = re.compile(r"\d+")
+SIGNED_INT = re.compile(r"-?\d+")
+
+
+def split_lines(input_data: str) -> list[str]:
+    """Split the input into lines, ignoring surrounding blank lines.
+
+    Parameters
+    ----------
+    input_data: str
+        The input data as a string
+
+    Returns
+    -------
+    list[str]
+        The lines of the input
+    """
+    return input_data.strip().split("\n")
+
+
+def extract_ints(text: str, signed: bool = False) -> "np.ndarray":
+    """Extract every integer in the text, in order, as an array.
+
+    All the numbers are found with a single regex scan and converted to integers
+    in bulk by NumPy rather than one `int()` call at a time.
+
+    Parameters
+    ----------
+    text: str
+        The text to scan
+    signed: bool
+        Whether a leading "-" makes a number negative. Leave this off for inputs
+        that use "-" as a separator, such as ranges like "3-5".
+
+    Returns
+    -------
+    np.ndarray
+        The integers as a 1-D int64 array
+    """
+    # Deferred so that solutions that only split lines never import NumPy
+    import numpy as np  # noqa: PLC0415
+
+    pattern = SIGNED_INT if signed else UNSIGNED_INT
+    return np.array(pattern.findall(text), dtype=np.int64)
@@ -0,0 +1,222 @@
+"""
+Reference Oracles.
+
+Frozen copies of the original, straightforward implementations that the
+optimized solution paths replaced, for `aoc fuzz` to check them against. They
+are deliberately kept apart from the solutions, so optimizing a solution can
+never change the oracle it is checked against. Do not optimize them.
+"""
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+
+# 2025 Day 1: step the dial one rotation at a time
+
+
+def turn(position: int, direction: str, distance: int) -> int:
+    """Turn the dial in the given direction for the given distance."""
+    if direction == "L":
+        return (position - distance) % 100
+    return (position + distance) % 100
+
+
+def turn_part2(position: int, direction: str, distance: int) -> tuple[int, int]:
+    """Turn the dial, returning where it ended and how often it pointed at 0."""
+    # Don't fall for its tricks! This has got to happen in the real input!
+    if distance == 0:
+        return position, 0
+
+    zeros = 0
+
+    # Anything over 100 is gravy. Only turn it by the modulo.
+    zeros += distance // 100
+    distance = distance % 100
+
+    if direction == "L":
+        # If it goes below 0, that's another zero.
+        if position - distance < 0 and position != 0:
+            zeros += 1
+        position = (position - distance) % 100
+        # If it ends up on 0 after the modulo, add another zero.
+        if position == 0:
+            zeros += 1
+    else:
+        # If it goes above 99, that's another zero.
+        if position + distance > 99:  # noqa: PLR2004
+            zeros += 1
+        position = (position + distance) % 100
+    return position, zeros
+
+
+def dial_stops(input_data: str) -> int:
+    """Count the rotations that leave the dial at 0 (2025 Day 1 Part 1)."""
+    position = 50
+    stops = 0
+    for line in input_data.strip().split("\n"):
+        position = turn(position, line[0], int(line[1:]))
+        if position == 0:
+            stops += 1
+    return stops
+
+
+def dial_clicks(input_data: str) -> int:
+    """Count every click that points the dial at 0 (2025 Day 1 Part 2)."""
+    position = 50
+    clicks = 0
+    for line in input_data.strip().split("\n"):
+        position, zeros = turn_part2(position, line[0], int(line[1:]))
+        clicks += zeros
+    return clicks
+
+
+# 2025 Day 2: check every ID in every range. The original search missed IDs of a
+# middle length in ranges that span several lengths, so the rules themselves are
+# the oracle.
+
+
+def is_repeated(idx: int, repeat: int) -> bool:
+    """Check whether an ID is a sequence of digits repeated exactly `repeat` times."""
+    digits = str(idx)
+    pattern_len, remainder = divmod(len(digits), repeat)
+    return remainder == 0 and digits[:pattern_len] * repeat == digits
+
+
+def invalid_id_sum(input_data: str, part: int) -> int:
+    """Sum the IDs repeated twice (Part 1) or any number of times (Part 2)."""
+    total = 0
+    for bounds in input_data.strip().split(","):
+        start_id, end_id = (int(idx) for idx in bounds.split("-"))
+        for idx in range(start_id, end_id + 1):
+            repeats = [2] if part == 1 else range(2, len(str(idx)) + 1)
+            if any(is_repeated(idx, repeat) for repeat in repeats):
+                total += idx
+    return total
+
+
+# 2025 Day 3: pick batteries recursively, largest first
+
+
+class PowerBank:
+    """A class encapsulating the power bank for Day 3."""
+
+    def __init__(self, bank_str: str) -> None:
+        """Initialize the power bank."""
+        self.bank_str = bank_str
+
+    def max_joltage(self, num_batteries: int) -> int:
+        """Get the maximum joltage possible from the bank."""
+        max_bank, _ = self._max_bank(
+            current_bank="",
+            remaining_bank=self.bank_str,
+            remaining_batteries=num_batteries,
+        )
+        return int(max_bank)
+
+    def _max_bank(
+        self, current_bank: str, remaining_bank: str, remaining_batteries: int
+    ) -> tuple[str, str]:
+        """Recursively get the max power bank consisting of N batteries."""
+        # If no more batteries to collect, then we're done!
+        if remaining_batteries == 0:
+            return current_bank, remaining_bank
+
+        # Need to know the number of remaining batteries
+        bank_len = len(remaining_bank)
+        # Need to know the unique battery capacities
+        battery_set = set(remaining_bank)
+        # Initialize the index (start at the first one)
+        max_battery_index = 0
+        while True:
+            # Pick the largest capacity
+            max_battery = max(battery_set)
+            # Remove it from the pool
+            battery_set.remove(max_battery)
+            # Get the index of the first-occurring battery with this capacity
+            max_battery_index = remaining_bank.index(max_battery)
+            # As long as there are enough batteries following it, we want it!
+            if (bank_len - max_battery_index) >= remaining_batteries:
+                # Update the current bank, remaining bank, and
+                # number of batteries still needed, then call it again!
+                current_bank = current_bank + max_battery
+                remaining_bank = remaining_bank[max_battery_index + 1 :]
+                remaining_batteries -= 1
+                return self._max_bank(
+                    current_bank=current_bank,
+                    remaining_bank=remaining_bank,
+                    remaining_batteries=remaining_batteries,
+                )
+
+
+def max_joltage_sum(input_data: str, num_batteries: int) -> int:
+    """Sum the maximum joltage of every bank (2025 Day 3)."""
+    return sum(
+        PowerBank(bank_str).max_joltage(num_batteries)
+        for bank_str in input_data.strip().split("\n")
+    )
+
+
+# 2025 Day 4: count and remove rolls of paper on a networkx graph
+
+
+def create_nodes(grid: list[str]) -> "nx.Graph":
+    """Create the paper graph."""
+    # networkx is slow to import, so only pay for it when the oracle runs
+    import networkx as nx  # noqa: PLC0415
+
+    g = nx.Graph()
+    for i in range(len(grid)):
+        for j in range(len(grid[0])):
+            if grid[i][j] == "@":
+                g.add_node((i, j))
+
+    return g
+
+
+def create_edges(g: "nx.Graph") -> None:
+    """Make connections."""
+    for node in g:
+        for i in (-1, 0, 1):
+            for j in (-1, 0, 1):
+                check_node = (node[0] + i, node[1] + j)
+                if (
+                    node != check_node
+                    and check_node[0] >= 0
+                    and check_node[1] >= 0
+                    and check_node in g.nodes
+                ):
+                    g.add_edge(node, check_node)
+
+
+def movable_rolls(input_data: str) -> int:
+    """Count the rolls of paper with fewer than four neighbours (2025 Day 4 Part 1)."""
+    g = create_nodes(input_data.strip().split("\n"))
+    create_edges(g)
+    num_movable = 0
+    for node in g:
+        if len(list(g.neighbors(node))) < 4:  # noqa: PLR2004
+            num_movable += 1
+    return num_movable
+
+
+def removable_rolls(input_data: str) -> int:
+    """Remove rolls of paper until no rolls can be removed (2025 Day 4 Part 2)."""
+    g = create_nodes(input_data.strip().split("\n"))
+    create_edges(g)
+    num_removed = 0
+    while True:
+        iter_removed = 0
+        g_copy = g.copy()
+        for node in g:
+            if len(list(g.neighbors(node))) < 4:  # noqa: PLR2004
+                num_removed += 1
+                iter_removed += 1
+                g_copy.remove_node(node)
+        # Stop once we cycle through and remove no rolls.
+        if iter_removed == 0:
+            break
+        g = g_copy
+    return num_removed
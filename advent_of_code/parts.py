@@ -0,0 +1,167 @@
+"""Run a solution's parts on input that is parsed only once."""
+
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+from typing import Any
+
+from advent_of_code.lib.jit import add_worker_backends, kernel_backends, reset_kernels
+from advent_of_code.lib.memo import reset_caches
+
+
+logger = logging.getLogger(__name__)
+
+# How the two parts can be run at the same time
+CONCURRENCY_MODES = ("thread", "process")
+
+# The functions a solution defines to have its input parsed once for both parts
+PART_FUNCTIONS = ("parse", "part1", "part2")
+
+# Logged exactly like the solutions always have, so timing export still sees them
+PART_MESSAGES = ("Part 1: %s (%.4fs)", "Part 2: %s (%.4fs)")
+# The log record attribute carrying the CPU time measured around each part
+CPU_TIME_ATTRIBUTE = "cpu_time"
+
+
+def _timed(part: Callable[[Any], int], parsed: object) -> tuple[int, float, float]:
+    """Run a part and measure its wall time and the CPU time of its thread.
+
+    The CPU time is measured on the thread that runs the part, so it stays
+    accurate when the other part runs at the same time in another thread or
+    process.
+    """
+    start_time = time.perf_counter()
+    start_cpu_time = time.thread_time()
+    result = part(parsed)
+    return (
+        result,
+        time.perf_counter() - start_time,
+        time.thread_time() - start_cpu_time,
+    )
+
+
+def _timed_in_worker(
+    part: Callable[[Any], int], parsed: object
+) -> tuple[int, float, float, dict[str, str]]:
+    """Run a part in a pool worker, also returning the backends its kernels ran on.
+
+    The kernels a worker calls are counted in the worker, so their backends are
+    sent back for the parent to report.
+    """
+    reset_kernels()
+    return (*_timed(part, parsed), kernel_backends())
+
+
+def run_parts(
+    parse: Callable[[str], Any],
+    part1: Callable[[Any], int],
+    part2: Callable[[Any], int],
+    input_data: str,
+    concurrency: str | None = None,
+) -> tuple[int, int]:
+    """Parse the input once and run both parts on the parsed result.
+
+    The parsed result is shared by both parts and must be treated as read-only.
+    With a concurrency mode, both parts run at the same time, so the end-to-end
+    time is the parse time plus the slower part rather than the sum of both.
+    The "process" mode needs the parts and parsed result to be picklable.
+
+    Parameters
+    ----------
+    parse: Callable[[str], Any]
+        Turns the input data into whatever the parts need
+    part1: Callable[[Any], int]
+        Solves Part 1 from the parsed input
+    part2: Callable[[Any], int]
+        Solves Part 2 from the parsed input
+    input_data: str
+        The input data as a string
+    concurrency: str | None
+        "thread" or "process" to run the parts at the same time, or None to run
+        them one after the other
+
+    Returns
+    -------
+    tuple[int, int]
+        A tuple of (part1_result, part2_result)
+    """
+    start_time = time.perf_counter()
+    parsed = parse(input_data)
+    parse_time = time.perf_counter() - start_time
+    logger.info("Parsed input (%.4fs)", parse_time)
+
+    if concurrency is None:
+        timed_results = [_timed(part1, parsed), _timed(part2, parsed)]
+    elif concurrency == "thread":
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(_timed, part, parsed) for part in (part1, part2)]
+            timed_results = [future.result() for future in futures]
+    elif concurrency == "process":
+        # Most runs never start a process pool, so only import it when one is used
+        from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+        with ProcessPoolExecutor(max_workers=2) as process_executor:
+            worker_futures = [
+                process_executor.submit(_timed_in_worker, part, parsed)
+                for part in (part1, part2)
+            ]
+            timed_results = []
+            for future in worker_futures:
+                result, part_time, cpu_time, backends = future.result()
+                add_worker_backends(backends)
+                timed_results.append((result, part_time, cpu_time))
+    else:
+        msg = f"Expected one of {CONCURRENCY_MODES} for concurrency."
+        raise ValueError(msg)
+
+    for message, (result, part_time, cpu_time) in zip(
+        PART_MESSAGES, timed_results, strict=True
+    ):
+        logger.info(message, result, part_time, extra={CPU_TIME_ATTRIBUTE: cpu_time})
+    logger.info("Total time (%.4fs)", time.perf_counter() - start_time)
+
+    part1_result, part2_result = (result for result, _, _ in timed_results)
+    return part1_result, part2_result
+
+
+def has_parts(module: ModuleType) -> bool:
+    """Indicate whether a solution module defines `parse`, `part1` and `part2`."""
+    return all(callable(getattr(module, name, None)) for name in PART_FUNCTIONS)
+
+
+def solve_module(
+    module: ModuleType, input_data: str, concurrency: str | None = None
+) -> tuple[int, int]:
+    """Solve with a module's parts if it has them, otherwise with its `solve`.
+
+    Memoized helpers start every solve with empty caches, and kernels with no
+    calls, so their counters describe this solve alone.
+
+    Parameters
+    ----------
+    module: ModuleType
+        The solution module
+    input_data: str
+        The input data as a string
+    concurrency: str | None
+        How to run the parts at the same time, as for `run_parts`
+
+    Returns
+    -------
+    tuple[int, int]
+        A tuple of (part1_result, part2_result)
+    """
+    reset_caches()
+    reset_kernels()
+    if has_parts(module):
+        return run_parts(
+            module.parse, module.part1, module.part2, input_data, concurrency
+        )
+    if concurrency is not None:
+        logger.warning(
+            "%s has no parse/part1/part2, so its parts run one after the other",
+            module.__name__,
+        )
+    return module.solve(input_data)
@@ -0,0 +1,221 @@
+"""
+Timing Trend Report.
+
+Aggregate exported timing records into per-day trend charts and flag parts that
+have slowed down compared with their recent history.
+"""
+
+import argparse
+import logging
+import statistics
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+
+from advent_of_code.timings import TimingRecord, read_records
+
+
+logger = logging.getLogger(__name__)
+
+# A part is slower if its latest run exceeds its recent median by this fraction
+DEFAULT_THRESHOLD = 0.2
+# The number of previous runs the latest one is compared against
+DEFAULT_WINDOW = 5
+# Ignore differences smaller than this many seconds, which are mostly noise
+DEFAULT_MIN_DELTA = 0.01
+
+SeriesKey = tuple[int, int, int, str]
+
+
+@dataclass(frozen=True)
+class Slowdown:
+    """A part whose latest run is slower than its recent median."""
+
+    year: int
+    day: int
+    part: int
+    mode: str
+    latest: float
+    baseline: float
+
+    @property
+    def ratio(self) -> float:
+        """Get how many times slower the latest run is."""
+        return self.latest / self.baseline if self.baseline else float("inf")
+
+
+def group_series(records: list[TimingRecord]) -> dict[SeriesKey, list[TimingRecord]]:
+    """Group records by (year, day, part, mode), each in chronological order."""
+    series: dict[SeriesKey, list[TimingRecord]] = defaultdict(list)
+    for record in sorted(records, key=lambda record: record.timestamp):
+        series[record.year, record.day, record.part, record.mode].append(record)
+    return dict(series)
+
+
+def find_slowdowns(
+    series: dict[SeriesKey, list[TimingRecord]],
+    threshold: float = DEFAULT_THRESHOLD,
+    window: int = DEFAULT_WINDOW,
+    min_delta: float = DEFAULT_MIN_DELTA,
+) -> list[Slowdown]:
+    """Find the parts whose latest run is slower than their recent median.
+
+    Parameters
+    ----------
+    series: dict[SeriesKey, list[TimingRecord]]
+        The chronological records of each part
+    threshold: float
+        The fraction above the median wall time that counts as a slowdown
+    window: int
+        The number of previous runs to take the median of
+    min_delta: float
+        The smallest increase in seconds that counts as a slowdown
+
+    Returns
+    -------
+    list[Slowdown]
+        The slowed-down parts
+    """
+    slowdowns = []
+    for (year, day, part, mode), records in sorted(series.items()):
+        if len(records) < 2:  # noqa: PLR2004
+            continue
+        latest = records[-1].wall_time
+        baseline = statistics.median(r.wall_time for r in records[-window - 1 : -1])
+        if latest > baseline * (1 + threshold) and latest - baseline >= min_delta:
+            slowdowns.append(Slowdown(year, day, part, mode, latest, baseline))
+    return slowdowns
+
+
+def plot_trends(series: dict[SeriesKey, list[TimingRecord]], output: Path) -> None:
+    """Draw one wall-time trend chart per day, with a line per part and mode."""
+    # matplotlib is slow to import and only needed here
+    import matplotlib as mpl  # noqa: PLC0415
+
+    mpl.use("Agg")
+    import matplotlib.pyplot as plt  # noqa: PLC0415
+
+    days = sorted({(year, day) for year, day, _, _ in series})
+    fig, axes = plt.subplots(
+        len(days), 1, figsize=(10, 3 * len(days)), squeeze=False, sharex=False
+    )
+    for ax, (year, day) in zip(axes[:, 0], days, strict=True):
+        for (s_year, s_day, part, mode), records in sorted(series.items()):
+            if (s_year, s_day) != (year, day):
+                continue
+            ax.plot(
+                range(1, len(records) + 1),
+                [record.wall_time for record in records],
+                marker="o",
+                label=f"Part {part} ({mode.lower()})",
+            )
+        ax.set_title(f"{year} Day {day}")
+        ax.set_xlabel("Run")
+        ax.set_ylabel("Wall time (s)")
+        ax.set_yscale("log")
+        ax.legend()
+    fig.tight_layout()
+    fig.savefig(output)
+    plt.close(fig)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the timing trend report."""
+    parser = argparse.ArgumentParser(
+        prog="aoc report",
+        description="Chart timing history and flag slowdowns",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s timings.jsonl                       # Chart to timings.png
+  %(prog)s timings.csv -o trends.png --fail-on-slowdown
+        """.strip(),
+    )
+    parser.add_argument(
+        "history", type=Path, help="Timing history exported with aoc --export"
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="Where to save the chart (default: the history path with .png)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Fraction above the recent median that counts as a slowdown "
+        f"(default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--window",
+        type=int,
+        default=DEFAULT_WINDOW,
+        help=f"Number of previous runs to compare against (default: {DEFAULT_WINDOW})",
+    )
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=DEFAULT_MIN_DELTA,
+        help="Smallest increase in seconds that counts as a slowdown "
+        f"(default: {DEFAULT_MIN_DELTA})",
+    )
+    parser.add_argument(
+        "--fail-on-slowdown",
+        action="store_true",
+        help="Exit with an error if any part has slowed down",
+    )
+
+    args = parser.parse_args(argv)
+
+    # Set up logging
+    logging.basicConfig(
+        level=logging.INFO, format="%(message)s", handlers=[logging.StreamHandler()]
+    )
+
+    if not args.history.exists():
+        logger.error("Timing history not found: %s", args.history)
+        sys.exit(1)
+
+    series = group_series(read_records(args.history))
+    if not series:
+        logger.error("No timing records in %s", args.history)
+        sys.exit(1)
+
+    for (year, day, part, mode), records in sorted(series.items()):
+        logger.info(
+            "%d Day %2d Part %d (%s): %d runs, latest %.4fs, best %.4fs",
+            year,
+            day,
+            part,
+            mode,
+            len(records),
+            records[-1].wall_time,
+            min(record.wall_time for record in records),
+        )
+
+    output = args.output or args.history.with_suffix(".png")
+    plot_trends(series, output)
+    logger.info("Saved trend charts to %s", output)
+
+    slowdowns = find_slowdowns(
+        series, threshold=args.threshold, window=args.window, min_delta=args.min_delta
+    )
+    for slowdown in slowdowns:
+        logger.warning(
+            "Slowdown: %d Day %d Part %d (%s) took %.4fs, %.2fx its recent %.4fs",
+            slowdown.year,
+            slowdown.day,
+            slowdown.part,
+            slowdown.mode,
+            slowdown.latest,
+            slowdown.ratio,
+            slowdown.baseline,
+        )
+    if slowdowns and args.fail_on_slowdown:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
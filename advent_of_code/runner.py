@@ -8,12 +8,27 @@ Run solutions for specific year/day combinations in test or challenge mode.
 import argparse
 import importlib
 import logging
+import os
 import sys
+import time
 from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from advent_of_code.isolation import IsolatedRun, ResourceLimits
+    from advent_of_code.lib.memo import CacheStats
+    from advent_of_code.timings import PartTiming
 
 
 logger = logging.getLogger(__name__)
 
+BYTES_PER_MB = 1024 * 1024
+
+# Commands that take the place of the year, by the module whose main runs them
+SUBCOMMANDS = {"report": "advent_of_code.report", "fuzz": "advent_of_code.fuzz"}
+
 
 def get_solution_module(year: int, day: int) -> tuple[str, Path]:
     """Get the solution module path and input file directory."""
@@ -24,8 +39,52 @@ def get_solution_module(year: int, day: int) -> tuple[str, Path]:
     return module_name, input_dir
 
 
-def run_solution(year: int, day: int, test_mode: bool = False) -> None:
-    """Run a solution for a specific year and day."""
+def get_days(year: int) -> list[int]:
+    """Get every day of a year that has a solution directory."""
+    year_dir = Path(__file__).parent / f"year_{year}"
+    return sorted(int(day_dir.name[4:]) for day_dir in year_dir.glob("day_[0-9]*"))
+
+
+def run_solution(  # noqa: PLR0913
+    year: int,
+    day: int,
+    *,
+    test_mode: bool = False,
+    limits: "ResourceLimits | None" = None,
+    export: Path | None = None,
+    concurrency: str | None = None,
+    stats: bool = False,
+    stream: bool = False,
+) -> bool:
+    """Run a solution for a specific year and day.
+
+    Parameters
+    ----------
+    year: int
+        The year of the challenge
+    day: int
+        The day of the challenge
+    test_mode: bool
+        Whether to use test_input.txt instead of input.txt
+    limits: ResourceLimits | None
+        If given, run the solve in a child process under these limits rather than
+        in this process
+    export: Path | None
+        If given, append a timing record per part to this JSON Lines (or .csv) file
+    concurrency: str | None
+        "thread" or "process" to run the parts at the same time, for solutions
+        that define parse/part1/part2
+    stats: bool
+        Whether to log the hit and miss counters of the memoized helpers
+    stream: bool
+        Whether to hand the input file to the solution's `stream_solve`, if it has
+        one, instead of reading the whole input into memory
+
+    Returns
+    -------
+    bool
+        Whether the solution ran successfully
+    """
     module_name, input_dir = get_solution_module(year, day)
 
     # Determine input file
@@ -38,13 +97,66 @@ def run_solution(year: int, day: int, test_mode: bool = False) -> None:
 
     if not input_file.exists():
         logger.error("Input file not found: %s", input_file)
-        sys.exit(1)
+        return False
+
+    if stream:
+        streamed = run_solution_streamed(
+            module_name, input_dir, input_file, f"{year} Day {day} ({mode_name} mode)"
+        )
+        if streamed is not None:
+            return streamed
 
     # Read input
     with input_file.open() as f:
         input_data = f.read().rstrip("\n")
 
-    # Import and run solution
+    if limits is not None:
+        run = run_solution_isolated(
+            module_name,
+            input_data,
+            limits,
+            f"{year} Day {day} ({mode_name} mode)",
+            concurrency=concurrency,
+        )
+        succeeded, timings, rss = run.succeeded, run.part_timings, run.peak_rss
+        log_kernel_backends(run.kernel_backends)
+        if stats:
+            log_cache_stats(run.cache_stats)
+    else:
+        module = import_solution_module(module_name, input_dir)
+        if module is None:
+            return False
+
+        logger.info("Running %d Day %d (%s mode)", year, day, mode_name)
+        logger.info("Input file: %s", input_file)
+        logger.info("-" * 60)
+
+        succeeded, timings, rss = solve_in_process(
+            module, input_data, record=export is not None, concurrency=concurrency
+        )
+        from advent_of_code.lib.jit import kernel_backends  # noqa: PLC0415
+
+        log_kernel_backends(kernel_backends())
+        if stats:
+            from advent_of_code.lib.memo import cache_stats  # noqa: PLC0415
+
+            log_cache_stats(cache_stats())
+
+    if succeeded and export is not None:
+        export_timings(
+            export,
+            year=year,
+            day=day,
+            mode_name=mode_name,
+            input_data=input_data,
+            timings=timings,
+            rss=rss,
+        )
+    return succeeded
+
+
+def import_solution_module(module_name: str, input_dir: Path) -> ModuleType | None:
+    """Import a solution module, checking that it has a `solve` function."""
     try:
         module = importlib.import_module(module_name)
     except ModuleNotFoundError:
@@ -53,27 +165,291 @@ def run_solution(year: int, day: int, test_mode: bool = False) -> None:
             module_name,
             input_dir / "solution.py",
         )
-        sys.exit(1)
+        return None
 
     if not hasattr(module, "solve"):
         logger.error(
             "Solution module must have a 'solve(input_data: str) -> tuple' function"
         )
-        sys.exit(1)
+        return None
+    return module
+
+
+def solve_in_process(
+    module: ModuleType,
+    input_data: str,
+    record: bool = False,
+    concurrency: str | None = None,
+) -> "tuple[bool, list[PartTiming], int | None]":
+    """Run a solution in this process.
+
+    Parameters
+    ----------
+    module: ModuleType
+        The solution module
+    input_data: str
+        The input data to pass to `solve`
+    record: bool
+        Whether to record the part timings and peak memory for export. The peak
+        memory covers this solve alone, or is None where it cannot be reset
+    concurrency: str | None
+        How to run the parts at the same time, if the solution has parts
+
+    Returns
+    -------
+    tuple[bool, list[PartTiming], int | None]
+        Whether it succeeded, the recorded part timings and the peak RSS in bytes
+    """
+    from advent_of_code.parts import solve_module  # noqa: PLC0415
+
+    if not record:
+        try:
+            solve_module(module, input_data, concurrency)
+        except Exception:
+            logger.exception("Error running solution")
+            return False, [], None
+        return True, [], None
+
+    # Timing export is optional, so only import it when it is used
+    from advent_of_code.timings import (  # noqa: PLC0415
+        peak_rss_since_reset,
+        record_part_timings,
+        reset_peak_rss,
+    )
 
-    logger.info("Running %d Day %d (%s mode)", year, day, mode_name)
+    # Earlier solves in this process would otherwise count towards the peak
+    measured = reset_peak_rss()
+    try:
+        with record_part_timings() as recorder:
+            solve_module(module, input_data, concurrency)
+    except Exception:
+        logger.exception("Error running solution")
+        return False, [], None
+    return True, recorder.timings, peak_rss_since_reset() if measured else None
+
+
+def run_solution_streamed(
+    module_name: str, input_dir: Path, input_file: Path, label: str
+) -> bool | None:
+    """Run a solution's `stream_solve` on an input file, in bounded memory.
+
+    Both parts are answered in one pass over the file, so they share one timing.
+
+    Returns
+    -------
+    bool | None
+        Whether it succeeded, or None if the solution has no `stream_solve` and
+        must read its whole input instead
+    """
+    module = import_solution_module(module_name, input_dir)
+    if module is None:
+        return False
+    if not hasattr(module, "stream_solve"):
+        logger.warning("%s has no stream_solve, so reads its whole input", module_name)
+        return None
+
+    logger.info("Running %s streamed", label)
     logger.info("Input file: %s", input_file)
     logger.info("-" * 60)
-
+    start_time = time.perf_counter()
     try:
-        module.solve(input_data)
+        part1_result, part2_result = module.stream_solve(input_file)
     except Exception:
         logger.exception("Error running solution")
-        sys.exit(1)
+        return False
+    logger.info("Part 1: %s", part1_result)
+    logger.info("Part 2: %s", part2_result)
+    logger.info("Streamed both parts in %.4fs", time.perf_counter() - start_time)
+    return True
 
 
-def main() -> None:
-    """Run the Advent of Code runner."""
+def log_kernel_backends(backends: dict[str, str]) -> None:
+    """Log which backend each kernel a solve called ran on."""
+    for name, backend in backends.items():
+        logger.info("Kernel %s ran on %s", name, backend)
+
+
+def log_cache_stats(stats: "list[CacheStats]") -> None:
+    """Log the hit and miss counters of each memoized helper a solve called."""
+    logger.info("-" * 60)
+    if not stats:
+        logger.info("No memoized helpers were called")
+        return
+    for helper in stats:
+        logger.info(
+            "Cache %s: %d hits, %d misses (%.1f%% hit rate), %d/%d entries",
+            helper.name,
+            helper.hits,
+            helper.misses,
+            100 * helper.hit_rate,
+            helper.size,
+            helper.maxsize,
+        )
+
+
+def export_timings(  # noqa: PLR0913
+    export: Path,
+    *,
+    year: int,
+    day: int,
+    mode_name: str,
+    input_data: str,
+    timings: "list[PartTiming]",
+    rss: int | None,
+) -> None:
+    """Append the timing records of a run to the export file."""
+    from advent_of_code.timings import build_records, write_records  # noqa: PLC0415
+
+    if not timings:
+        logger.warning("No part timings were logged, so nothing was exported")
+        return
+    write_records(
+        export,
+        build_records(
+            year=year,
+            day=day,
+            mode=mode_name,
+            input_data=input_data,
+            timings=timings,
+            rss=rss,
+        ),
+    )
+
+
+def run_solution_batch(
+    year: int,
+    day: int,
+    input_dir: Path,
+    max_workers: int | None = None,
+    concurrency: str | None = None,
+) -> bool:
+    """Solve every input in a directory, importing the solution only once.
+
+    Parameters
+    ----------
+    year: int
+        The year of the challenge
+    day: int
+        The day of the challenge
+    input_dir: Path
+        The directory of inputs to solve
+    max_workers: int | None
+        The most worker processes to spread the inputs over, or None for one per CPU
+    concurrency: str | None
+        How to run the parts of each solve at the same time
+
+    Returns
+    -------
+    bool
+        Whether every input was solved successfully
+    """
+    # Batch mode pulls in multiprocessing, so only import it when it is used
+    from advent_of_code.batch import format_table, input_files, run_batch  # noqa: PLC0415
+
+    module_name, solution_dir = get_solution_module(year, day)
+    if not input_dir.is_dir():
+        logger.error("Input directory not found: %s", input_dir)
+        return False
+    files = input_files(input_dir)
+    if not files:
+        logger.error("No input files in %s", input_dir)
+        return False
+    if import_solution_module(module_name, solution_dir) is None:
+        return False
+
+    logger.info(
+        "Running %d Day %d on %d inputs from %s", year, day, len(files), input_dir
+    )
+    logger.info("-" * 60)
+
+    start_time = time.perf_counter()
+    results = run_batch(module_name, files, max_workers, concurrency)
+    elapsed = time.perf_counter() - start_time
+
+    for line in format_table(results):
+        logger.info(line)
+    logger.info("-" * 60)
+    logger.info(
+        "Solved %d inputs in %.4fs (%.4fs of solving)",
+        len(results),
+        elapsed,
+        sum(batch_result.wall_time for batch_result in results),
+    )
+    failed = [r.input_file.name for r in results if not r.succeeded]
+    if failed:
+        logger.error("Failed inputs: %s", ", ".join(failed))
+    return not failed
+
+
+def run_solution_isolated(
+    module_name: str,
+    input_data: str,
+    limits: "ResourceLimits",
+    label: str,
+    concurrency: str | None = None,
+) -> "IsolatedRun":
+    """Run a solution in a child process under resource limits and report it."""
+    # Isolation pulls in multiprocessing, so only import it when it is used
+    from advent_of_code.isolation import run_isolated  # noqa: PLC0415
+
+    logger.info("Running %s isolated", label)
+    logger.info("-" * 60)
+
+    run = run_isolated(module_name, input_data, limits, concurrency)
+
+    peak_rss = (
+        f"{run.peak_rss / BYTES_PER_MB:.1f} MB" if run.peak_rss is not None else "n/a"
+    )
+    logger.info("Status: %s (%.4fs, peak RSS %s)", run.status, run.wall_time, peak_rss)
+    if run.error:
+        logger.error(run.error.rstrip())
+    return run
+
+
+def run_year(  # noqa: PLR0913
+    year: int,
+    *,
+    test_mode: bool = False,
+    limits: "ResourceLimits | None" = None,
+    export: Path | None = None,
+    concurrency: str | None = None,
+    stats: bool = False,
+    stream: bool = False,
+) -> bool:
+    """Run every day of a year that has a solution, as `run_solution` would.
+
+    Returns
+    -------
+    bool
+        Whether every day ran successfully
+    """
+    days = get_days(year)
+    if not days:
+        logger.error("No solutions found for %d", year)
+        return False
+    failed = [
+        day
+        for day in days
+        if not run_solution(
+            year,
+            day,
+            test_mode=test_mode,
+            limits=limits,
+            export=export,
+            concurrency=concurrency,
+            stats=stats,
+            stream=stream,
+        )
+    ]
+    logger.info("=" * 60)
+    logger.info("Ran %d days, %d failed", len(days), len(failed))
+    if failed:
+        logger.error("Failed days: %s", ", ".join(str(day) for day in failed))
+    return not failed
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser of the runner."""
     parser = argparse.ArgumentParser(
         description="Run Advent of Code solutions",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -82,32 +458,213 @@ Examples:
   %(prog)s 2024 1              # Run 2024 Day 1 in challenge mode
   %(prog)s 2024 1 --test       # Run 2024 Day 1 in test mode
   %(prog)s 2025 12 --test      # Run 2025 Day 12 in test mode
+  %(prog)s 2025 --all --isolate --timeout 60
+                               # Run every 2025 day, each in its own process
+  %(prog)s 2025 4 --export timings.jsonl
+                               # Append 2025 Day 4 part timings to a history
+  %(prog)s 2025 6 --parallel-parts thread
+                               # Parse once, then run both parts at the same time
+  %(prog)s 2025 3 --stats      # Show how often memoized helpers hit their cache
+  %(prog)s 2025 6 --stream     # Stream the input file in bounded memory
+  %(prog)s 2025 3 --jit        # Compile the hot loops with Numba, if installed
+  %(prog)s 2025 3 --inputs inputs/day_03/
+                               # Solve every input in a directory, one table
+  %(prog)s report timings.jsonl
+                               # Chart the history and flag slowdowns
+  %(prog)s fuzz --day 4        # Check 2025 Day 4 against its reference oracle
         """.strip(),
     )
     parser.add_argument("year", type=int, help="Year of the challenge (e.g., 2024)")
     parser.add_argument(
         "day",
         type=int,
+        nargs="?",
         help="Day of the challenge (1-24 for most years, 1-12 for 2025+)",
     )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Run every day of the year that has a solution",
+    )
     parser.add_argument(
         "--test",
         action="store_true",
         help="Run in test mode (uses test_input.txt instead of input.txt)",
     )
+    parser.add_argument(
+        "--export",
+        type=Path,
+        metavar="PATH",
+        help="Append a timing record per part to a JSON Lines file (or .csv)",
+    )
+    parser.add_argument(
+        "--parallel-parts",
+        choices=["thread", "process"],
+        help="Run Part 1 and Part 2 at the same time, for solutions that define "
+        "parse/part1/part2",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Show the hit and miss counters of the memoized helpers after a solve",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream the input file through stream_solve, for solutions that "
+        "define it, instead of reading it whole",
+    )
+    parser.add_argument(
+        "--jit",
+        action="store_true",
+        help="Compile the hot loops with Numba, if it is installed (same as AOC_JIT=1)",
+    )
+    batch = parser.add_argument_group(
+        "batch",
+        "Solve many inputs of one day, importing the solution only once.",
+    )
+    batch.add_argument(
+        "--inputs",
+        type=Path,
+        metavar="DIR",
+        help="Solve every file in this directory instead of input.txt",
+    )
+    batch.add_argument(
+        "--max-workers",
+        type=int,
+        help="Worker processes to spread the inputs over (default: one per CPU)",
+    )
+    isolation = parser.add_argument_group(
+        "isolation",
+        "Run each solve in a child process under resource limits. "
+        "Any limit implies --isolate.",
+    )
+    isolation.add_argument(
+        "--isolate",
+        action="store_true",
+        help="Run each solve in a child process",
+    )
+    isolation.add_argument(
+        "--timeout",
+        type=float,
+        help="Wall-clock seconds before a solve is killed",
+    )
+    isolation.add_argument(
+        "--memory-limit",
+        type=int,
+        metavar="MB",
+        help="Address space a solve may use (RLIMIT_AS), in MB",
+    )
+    isolation.add_argument(
+        "--cpu-limit",
+        type=int,
+        metavar="SECONDS",
+        help="CPU time a solve may use (RLIMIT_CPU), in seconds",
+    )
+    return parser
+
+
+def resource_limits(args: argparse.Namespace) -> "ResourceLimits | None":
+    """Get the isolation limits asked for on the command line, if any."""
+    if not args.isolate and all(
+        limit is None for limit in (args.timeout, args.memory_limit, args.cpu_limit)
+    ):
+        return None
+
+    from advent_of_code.isolation import ResourceLimits  # noqa: PLC0415
+
+    return ResourceLimits(
+        timeout=args.timeout,
+        memory=args.memory_limit * BYTES_PER_MB if args.memory_limit else None,
+        cpu_time=args.cpu_limit,
+    )
+
 
+def check_arguments(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Exit with a usage error if the runner's options cannot be combined."""
+    if (args.day is None) == (not args.all):
+        parser.error("Provide either a day or --all, but not both")
+    if args.inputs is not None and (
+        args.all or args.test or args.export or args.stats or resource_limits(args)
+    ):
+        parser.error(
+            "--inputs runs a single day, so it cannot be combined "
+            "with --all, --test, --export, --stats or isolation"
+        )
+    if args.stream and (
+        args.inputs is not None
+        or args.export
+        or args.parallel_parts
+        or resource_limits(args)
+    ):
+        parser.error(
+            "--stream reads the input file itself, so it cannot be combined "
+            "with --inputs, --export, --parallel-parts or isolation"
+        )
+
+
+def main() -> None:
+    """Run the Advent of Code runner."""
+    if len(sys.argv) > 1 and sys.argv[1] in SUBCOMMANDS:
+        # Subcommands have their own parsers and are only imported when used
+        importlib.import_module(SUBCOMMANDS[sys.argv[1]]).main(sys.argv[2:])
+        return
+
+    parser = build_parser()
     args = parser.parse_args()
+    check_arguments(parser, args)
 
     # Set up logging
     logging.basicConfig(
         level=logging.INFO, format="%(message)s", handlers=[logging.StreamHandler()]
     )
 
+    if args.jit:
+        from advent_of_code.lib.jit import JIT_ENV  # noqa: PLC0415
+
+        # Set in the environment, so child processes and pool workers compile too
+        os.environ[JIT_ENV] = "1"
+
+    limits = resource_limits(args)
+
+    if args.all:
+        if not run_year(
+            args.year,
+            test_mode=args.test,
+            limits=limits,
+            export=args.export,
+            concurrency=args.parallel_parts,
+            stats=args.stats,
+            stream=args.stream,
+        ):
+            sys.exit(1)
+        return
+
     max_day = 24
     if args.day < 1 or args.day > max_day:
         logger.warning("Day %d is outside typical range (1-%d)", args.day, max_day)
 
-    run_solution(args.year, args.day, test_mode=args.test)
+    if args.inputs is not None:
+        succeeded = run_solution_batch(
+            args.year,
+            args.day,
+            args.inputs,
+            max_workers=args.max_workers,
+            concurrency=args.parallel_parts,
+        )
+    else:
+        succeeded = run_solution(
+            args.year,
+            args.day,
+            test_mode=args.test,
+            limits=limits,
+            export=args.export,
+            concurrency=args.parallel_parts,
+            stats=args.stats,
+            stream=args.stream,
+        )
+    if not succeeded:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
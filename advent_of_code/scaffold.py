@@ -6,29 +6,145 @@ Creates the directory structure and template files for a new challenge.
 """
 
 import argparse
+import hashlib
+import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import requests
-from dotenv import load_dotenv
+
+if TYPE_CHECKING:
+    import requests
 
 
 logger = logging.getLogger(__name__)
 
-# Load environment variables from .env file
-load_dotenv()
+AOC_URL = "https://adventofcode.com"
+# Where new days are scaffolded, one directory per year
+PACKAGE_DIR = Path(__file__).parent
+# Be polite: never have more than this many requests in flight at once
+MAX_CONCURRENT_FETCHES = 4
+# Days with a puzzle; 2025 onwards has 12, earlier years have 25
+FIRST_SHORT_YEAR = 2025
+SHORT_YEAR_DAYS = 12
+LONG_YEAR_DAYS = 25
+
+
+def days_in_year(year: int) -> int:
+    """Get the number of puzzle days in a given year."""
+    return SHORT_YEAR_DAYS if year >= FIRST_SHORT_YEAR else LONG_YEAR_DAYS
+
+
+def create_session(pool_size: int = MAX_CONCURRENT_FETCHES) -> "requests.Session":
+    """Create a pooled HTTP session that retries transient failures with backoff.
+
+    Parameters
+    ----------
+    pool_size: int
+        The number of connections to keep open to the server
+
+    Returns
+    -------
+    requests.Session
+        The session, carrying the AoC session cookie if one is set
+    """
+    # requests is only needed when fetching, so keep it out of module import time
+    import requests  # noqa: PLC0415
+    from requests.adapters import HTTPAdapter  # noqa: PLC0415
+    from urllib3.util.retry import Retry  # noqa: PLC0415
+
+    retry = Retry(
+        total=3,
+        backoff_factor=1.0,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",),
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session_token = os.getenv("AOC_SESSION_TOKEN")
+    if session_token:
+        session.cookies.set("session", session_token)
+    return session
+
+
+def _cache_paths(year: int, day: int) -> tuple[Path, Path]:
+    """Get the cached input file and its validator metadata file.
+
+    Every account has its own puzzle inputs, so the cache is kept per session
+    token, under a hash of it rather than the token itself.
+    """
+    cache_dir = Path(
+        os.getenv("AOC_CACHE_DIR", Path.home() / ".cache" / "advent_of_code")
+    )
+    token = os.getenv("AOC_SESSION_TOKEN", "")
+    account = hashlib.sha256(token.encode()).hexdigest()[:16]
+    stem = cache_dir / account / str(year) / f"day_{day:02d}"
+    return stem.with_suffix(".txt"), stem.with_suffix(".json")
+
+
+def _download_input(session: "requests.Session", year: int, day: int) -> str:
+    """Download an input, revalidating and refreshing its cached copy."""
+    cache_file, meta_file = _cache_paths(year, day)
+    headers = {}
+    if cache_file.exists() and meta_file.exists():
+        validators = json.loads(meta_file.read_text())
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    base_url = os.getenv("AOC_BASE_URL", AOC_URL).rstrip("/")
+    url = f"{base_url}/{year}/day/{day}/input"
+    response = session.get(url, headers=headers, timeout=10)
+
+    if response.status_code == HTTPStatus.NOT_MODIFIED and headers:
+        logger.info("Using cached input for %d Day %d", year, day)
+        return cache_file.read_text()
+
+    if not response.ok:
+        msg = (
+            "Failed to fetch input data from "
+            f"{url}: {response.status_code} {response.reason}"
+        )
+        raise RuntimeError(msg)
+
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache_file.write_text(response.text)
+    meta_file.write_text(
+        json.dumps(
+            {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+        )
+    )
+    return response.text
 
 
-def fetch_input_data(year: int, day: int) -> str:
+def fetch_input_data(
+    year: int, day: int, session: "requests.Session | None" = None
+) -> str:
     """Fetch input data from Advent of Code website.
 
+    Inputs are cached on disk with the response's ETag and Last-Modified headers.
+    A cached input is revalidated with a conditional request and only downloaded
+    again if the server reports that it has changed. If the server cannot be
+    reached, or keeps failing after the session's retries, the cached input is
+    used instead.
+
     Parameters
     ----------
     year: int
         The year of the challenge
     day: int
         The day of the challenge
+    session: requests.Session | None
+        A pooled session to reuse. Defaults to a new one from `create_session`.
 
     Returns
     -------
@@ -36,34 +152,54 @@ def fetch_input_data(year: int, day: int) -> str:
         The input data as a string, or empty string if fetch fails
     """
     try:
-        session_token = os.getenv("AOC_SESSION_TOKEN")
-        if not session_token:
+        if not os.getenv("AOC_SESSION_TOKEN"):
             msg = "AOC_SESSION_TOKEN environment variable not set."
             raise RuntimeError(msg)  # noqa: TRY301
 
-        url = f"https://adventofcode.com/{year}/day/{day}/input"
-        response = requests.get(url, cookies={"session": session_token}, timeout=10)
-
-        if not response.ok:
-            msg = (
-                "Failed to fetch input data from "
-                f"{url}: {response.status_code} {response.reason}"
+        if session is None:
+            session = create_session()
+
+        cache_file, _ = _cache_paths(year, day)
+        try:
+            return _download_input(session, year, day)
+        except Exception as exc:
+            if not cache_file.exists():
+                raise
+            logger.warning(
+                "Could not fetch %d Day %d, so using the cached input: %s",
+                year,
+                day,
+                exc,
             )
-            raise RuntimeError(msg)  # noqa: TRY301
-
-        return response.text  # noqa: TRY300
+            return cache_file.read_text()
 
     except Exception as exc:
         msg = f"Error fetching input data: {exc}"
         raise RuntimeError(msg) from exc
 
 
-def scaffold_day(year: int, day: int) -> None:
-    """Create the directory structure and template files for a new day."""
+def scaffold_day(
+    year: int,
+    day: int,
+    input_data: str | None = None,
+    base_dir: Path = PACKAGE_DIR,
+) -> None:
+    """Create the directory structure and template files for a new day.
+
+    Parameters
+    ----------
+    year: int
+        The year of the challenge
+    day: int
+        The day of the challenge
+    input_data: str | None
+        The already-fetched input. Defaults to fetching it from the website.
+    base_dir: Path
+        The directory holding the year directories
+    """
     year_str = f"year_{year}"
     day_str = f"day_{day:02d}"
 
-    base_dir = Path(__file__).parent
     year_dir = base_dir / year_str
     day_dir = year_dir / day_str
 
@@ -84,12 +220,31 @@ def scaffold_day(year: int, day: int) -> None:
     solution_template = f'''"""Advent of Code {year} - Day {day}."""
 
 import logging
-import time
+
+from advent_of_code import lib
+from advent_of_code.parts import run_parts
 
 
 logger = logging.getLogger(__name__)
 
 
+def parse(input_data: str) -> list[str]:
+    """Parse the input once for both parts."""
+    return lib.split_lines(input_data)
+
+
+def part1(lines: list[str]) -> int:  # noqa: ARG001
+    """Perform part 1 of the challenge."""
+    # Part 1: Your solution here
+    return 0
+
+
+def part2(lines: list[str]) -> int:  # noqa: ARG001
+    """Perform part 2 of the challenge."""
+    # Part 2: Your solution here
+    return 0
+
+
 def solve(input_data: str) -> tuple[int, int]:
     """
     Solve the Advent of Code challenge.
@@ -104,21 +259,7 @@ def solve(input_data: str) -> tuple[int, int]:
     tuple[int, int]
         A tuple of (part1_result, part2_result)
     """
-    lines = input_data.strip().split("\\n")  # noqa: F841
-
-    # Part 1: Your solution here
-    start_time = time.perf_counter()
-    part1_result = 0
-    part1_time = time.perf_counter() - start_time
-    logger.info("Part 1: %s (%.4fs)", part1_result, part1_time)
-
-    # Part 2: Your solution here
-    start_time = time.perf_counter()
-    part2_result = 0
-    part2_time = time.perf_counter() - start_time
-    logger.info("Part 2: %s (%.4fs)", part2_result, part2_time)
-
-    return part1_result, part2_result
+    return run_parts(parse, part1, part2, input_data)
 
 '''
     (day_dir / "solution.py").write_text(solution_template)
@@ -129,7 +270,8 @@ def solve(input_data: str) -> tuple[int, int]:
     )
 
     # Fetch and write input.txt
-    input_data = fetch_input_data(year, day)
+    if input_data is None:
+        input_data = fetch_input_data(year, day)
     if input_data:
         (day_dir / "input.txt").write_text(input_data)
     else:
@@ -159,6 +301,52 @@ def solve(input_data: str) -> tuple[int, int]:
     logger.info("  %d. Run with: aoc %d %d --test", step + 1, year, day)
 
 
+def scaffold_year(
+    year: int, max_workers: int = MAX_CONCURRENT_FETCHES, base_dir: Path = PACKAGE_DIR
+) -> None:
+    """Scaffold every missing day of a year, fetching the inputs concurrently.
+
+    All fetches share one pooled session. A day whose input cannot be fetched
+    (e.g. one that has not unlocked yet) is skipped with a warning, so a later run
+    picks it up once it is available.
+
+    Parameters
+    ----------
+    year: int
+        The year of the challenge
+    max_workers: int
+        The maximum number of inputs to fetch at once
+    base_dir: Path
+        The directory holding the year directories
+    """
+    year_dir = base_dir / f"year_{year}"
+    missing_days = [
+        day
+        for day in range(1, days_in_year(year) + 1)
+        if not (year_dir / f"day_{day:02d}").exists()
+    ]
+    if not missing_days:
+        logger.info("Every day of %d is already scaffolded.", year)
+        return
+
+    with (
+        create_session(pool_size=max_workers) as session,
+        ThreadPoolExecutor(max_workers=max_workers) as executor,
+    ):
+        futures = {
+            day: executor.submit(fetch_input_data, year, day, session)
+            for day in missing_days
+        }
+
+    for day, future in futures.items():
+        try:
+            input_data = future.result()
+        except RuntimeError as exc:
+            logger.warning("Skipping %d Day %d. %s", year, day, exc)
+            continue
+        scaffold_day(year, day, input_data=input_data, base_dir=base_dir)
+
+
 def main() -> None:
     """Run the scaffold script."""
     parser = argparse.ArgumentParser(
@@ -166,24 +354,49 @@ def main() -> None:
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
-  %(prog)s 2024 1    # Create structure for 2024 Day 1
-  %(prog)s 2025 12   # Create structure for 2025 Day 12
+  %(prog)s 2024 1       # Create structure for 2024 Day 1
+  %(prog)s 2025 12      # Create structure for 2025 Day 12
+  %(prog)s 2025 --all   # Create structure for every missing 2025 day
         """.strip(),
     )
     parser.add_argument("year", type=int, help="Year of the challenge (e.g., 2024)")
     parser.add_argument(
         "day",
         type=int,
+        nargs="?",
         help="Day of the challenge (1-24 for most years, 1-12 for 2025+)",
     )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Scaffold every missing day of the year, fetching inputs concurrently",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=MAX_CONCURRENT_FETCHES,
+        help="Maximum number of inputs to fetch at once with --all "
+        f"(default: {MAX_CONCURRENT_FETCHES})",
+    )
 
     args = parser.parse_args()
+    if (args.day is None) == (not args.all):
+        parser.error("Provide either a day or --all, but not both")
 
     # Set up logging
     logging.basicConfig(
         level=logging.INFO, format="%(message)s", handlers=[logging.StreamHandler()]
     )
 
+    # Load environment variables from .env file
+    from dotenv import load_dotenv  # noqa: PLC0415
+
+    load_dotenv()
+
+    if args.all:
+        scaffold_year(args.year, max_workers=args.max_workers)
+        return
+
     max_day = 24
     if args.day < 1 or args.day > max_day:
         logger.warning("Day %d is outside typical range (1-%d)", args.day, max_day)
@@ -0,0 +1,268 @@
+"""Record solution timings and export them as JSON Lines or CSV."""
+
+import csv
+import hashlib
+import json
+import logging
+import re
+import resource
+import subprocess
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, fields
+from datetime import UTC, datetime
+from functools import cache
+from pathlib import Path
+
+from advent_of_code.parts import CPU_TIME_ATTRIBUTE
+
+
+logger = logging.getLogger(__name__)
+
+# Solutions log each answer as "Part N: <answer> (<seconds>s)"
+PART_MESSAGE = re.compile(r"^Part (\d+): %s \(%\.\d+fs\)$")
+
+# Writing "5" here resets this process's VmHWM (peak RSS) on Linux
+CLEAR_REFS = Path("/proc/self/clear_refs")
+PROCESS_STATUS = Path("/proc/self/status")
+
+
+@dataclass(frozen=True)
+class PartTiming:
+    """The answer and timing of one part, as logged by a solution.
+
+    Attributes
+    ----------
+    part: int
+        The part number
+    answer: str
+        The answer, as text
+    wall_time: float
+        Wall-clock seconds the solution reported for the part
+    cpu_time: float
+        CPU seconds measured around the part by `run_parts`, or for solutions that
+        time themselves, since the previous part was logged (or the solve started)
+    """
+
+    part: int
+    answer: str
+    wall_time: float
+    cpu_time: float
+
+
+@dataclass(frozen=True)
+class TimingRecord:
+    """One exported timing record, for a single part of a single run."""
+
+    timestamp: str
+    year: int
+    day: int
+    part: int
+    mode: str
+    answer_hash: str
+    wall_time: float
+    cpu_time: float
+    peak_rss: int | None
+    git_commit: str | None
+    input_size: int
+
+
+class PartTimingRecorder(logging.Handler):
+    """Collect the "Part N" answer and timing log records a solution emits."""
+
+    def __init__(self) -> None:
+        """Start recording from the current CPU time."""
+        super().__init__()
+        self.timings: list[PartTiming] = []
+        self._last_cpu_time = time.process_time()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Keep the record if it is a part answer."""
+        match = PART_MESSAGE.match(str(record.msg))
+        if not match or not isinstance(record.args, tuple):
+            return
+        answer, wall_time = record.args
+        cpu_time = time.process_time()
+        part_cpu_time = getattr(record, CPU_TIME_ATTRIBUTE, None)
+        self.timings.append(
+            PartTiming(
+                part=int(match.group(1)),
+                answer=str(answer),
+                wall_time=float(wall_time),  # type: ignore[arg-type]
+                cpu_time=(
+                    cpu_time - self._last_cpu_time
+                    if part_cpu_time is None
+                    else part_cpu_time
+                ),
+            )
+        )
+        self._last_cpu_time = cpu_time
+
+
+@contextmanager
+def record_part_timings() -> Iterator[PartTimingRecorder]:
+    """Record the part timings logged while the context is active."""
+    recorder = PartTimingRecorder()
+    root_logger = logging.getLogger()
+    root_logger.addHandler(recorder)
+    try:
+        yield recorder
+    finally:
+        root_logger.removeHandler(recorder)
+
+
+def answer_hash(answer: str) -> str:
+    """Hash an answer, so changes are visible without storing the answer."""
+    return hashlib.sha256(answer.encode()).hexdigest()[:16]
+
+
+def peak_rss() -> int:
+    """Get the peak resident set size of this process in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def reset_peak_rss() -> bool:
+    """Reset the peak resident set size of this process to its current size.
+
+    `peak_rss` never goes down, so a process that runs several solves needs this to
+    measure each one on its own.
+
+    Returns
+    -------
+    bool
+        Whether the peak was reset, which needs Linux
+    """
+    try:
+        CLEAR_REFS.write_text("5")
+    except OSError:
+        return False
+    return True
+
+
+def peak_rss_since_reset() -> int | None:
+    """Get the peak resident set size in bytes since `reset_peak_rss`, if known."""
+    try:
+        for line in PROCESS_STATUS.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+@cache
+def git_commit() -> str | None:
+    """Get the commit the package is running from, if it is in a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],  # noqa: S607
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def build_records(  # noqa: PLR0913
+    *,
+    year: int,
+    day: int,
+    mode: str,
+    input_data: str,
+    timings: list[PartTiming],
+    rss: int | None,
+) -> list[TimingRecord]:
+    """Build one timing record per part of a run.
+
+    Parameters
+    ----------
+    year: int
+        The year of the challenge
+    day: int
+        The day of the challenge
+    mode: str
+        The input mode, e.g. "TEST" or "CHALLENGE"
+    input_data: str
+        The input the solution ran on
+    timings: list[PartTiming]
+        The part timings recorded during the run
+    rss: int | None
+        The peak resident set size of the run in bytes, if known
+
+    Returns
+    -------
+    list[TimingRecord]
+        The records, in part order
+    """
+    timestamp = datetime.now(UTC).isoformat()
+    input_size = len(input_data.encode())
+    return [
+        TimingRecord(
+            timestamp=timestamp,
+            year=year,
+            day=day,
+            part=timing.part,
+            mode=mode,
+            answer_hash=answer_hash(timing.answer),
+            wall_time=timing.wall_time,
+            cpu_time=timing.cpu_time,
+            peak_rss=rss,
+            git_commit=git_commit(),
+            input_size=input_size,
+        )
+        for timing in timings
+    ]
+
+
+def write_records(path: Path, records: list[TimingRecord]) -> None:
+    """Append timing records to a JSON Lines file, or a CSV file by suffix."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".csv":
+        is_new = not path.exists() or path.stat().st_size == 0
+        with path.open("a", newline="") as f:
+            field_names = [field.name for field in fields(TimingRecord)]
+            writer = csv.DictWriter(f, fieldnames=field_names)
+            if is_new:
+                writer.writeheader()
+            writer.writerows(asdict(record) for record in records)
+        return
+
+    with path.open("a") as f:
+        for record in records:
+            f.write(json.dumps(asdict(record)) + "\n")
+
+
+def read_records(path: Path) -> list[TimingRecord]:
+    """Read timing records from a JSON Lines or CSV file."""
+    with path.open(newline="") as f:
+        if path.suffix == ".csv":
+            rows = list(csv.DictReader(f))
+        else:
+            rows = [json.loads(line) for line in f if line.strip()]
+
+    def optional(value: object) -> str | None:
+        return None if value in (None, "") else str(value)
+
+    return [
+        TimingRecord(
+            timestamp=str(row["timestamp"]),
+            year=int(row["year"]),
+            day=int(row["day"]),
+            part=int(row["part"]),
+            mode=str(row["mode"]),
+            answer_hash=str(row["answer_hash"]),
+            wall_time=float(row["wall_time"]),
+            cpu_time=float(row["cpu_time"]),
+            peak_rss=int(rss) if (rss := optional(row["peak_rss"])) else None,
+            git_commit=optional(row["git_commit"]),
+            input_size=int(row["input_size"]),
+        )
+        for row in rows
+    ]
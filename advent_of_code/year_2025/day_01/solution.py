@@ -1,77 +1,84 @@
 """Advent of Code 2025 - Day 1."""
 
 import logging
-import time
+from itertools import accumulate
 
+from advent_of_code.lib import kernel, split_lines
+from advent_of_code.parts import run_parts
 
-logger = logging.getLogger(__name__)
 
+logger = logging.getLogger(__name__)
 
-def turn(position: int, direction: str, distance: int) -> int:
-    """Turn the dial in the given direction for the given distance.
 
-    Parameters
-    ----------
-    position: int
-        The current position of the dial
-    direction: str
-        The direction to turn the dial
-    distance: int
-        The distance to turn the dial
+def parse(input_data: str) -> tuple[list[bool], list[int]]:
+    """Parse the rotations into whether they turn left and their distances.
 
-    Returns
-    -------
-    int
-        The new position of the dial
+    The input is small, so plain lists keep NumPy from being imported at all, which
+    would take far longer than the solve.
     """
-    if direction == "L":
-        return (position - distance) % 100
-    return (position + distance) % 100
+    lines = split_lines(input_data)
+    return [line[0] == "L" for line in lines], [int(line[1:]) for line in lines]
+
+
+def part1(rotations: tuple[list[bool], list[int]]) -> int:
+    """Count how many rotations leave the dial pointing at 0."""
+    turns_left, distances = rotations
+    # The dial positions are a running sum of the signed turns, modulo its size
+    steps = (
+        -distance if turn_left else distance
+        for turn_left, distance in zip(turns_left, distances, strict=True)
+    )
+    return sum(position % 100 == 0 for position in accumulate(steps, initial=50))
 
 
-def turn_part2(position: int, direction: str, distance: int) -> tuple[int, int]:
-    """Turn the dial in the given direction for the given distance.
+@kernel()
+def count_zero_clicks(turns_left: list[bool], distances: list[int]) -> int:
+    """Step the dial through every rotation, counting the clicks that land on 0.
 
-    Return the position it ended at along with the number of times it pointed at 0.
+    This is `advent_of_code.oracles.turn_part2` unrolled into a single loop, so it
+    can be JIT-compiled.
 
     Parameters
     ----------
-    position: int
-        The current position of the dial
-    direction: str
-        The direction to turn the dial
-    distance: int
-        The distance to turn the dial
+    turns_left: list[bool]
+        Whether each rotation turns the dial left
+    distances: list[int]
+        The distance of each rotation
 
     Returns
     -------
-    tuple[int, int]
-        The new position of the dial and the number of times it pointed at 0
+    int
+        The number of times the dial pointed at 0
     """
-    # Don't fall for its tricks! This has got to happen in the real input!
-    if distance == 0:
-        return position, 0
-
+    position = 50
     zeros = 0
-
-    # Anything over 100 is gravy. Only turn it by the modulo.
-    zeros += distance // 100
-    distance = distance % 100
-
-    if direction == "L":
-        # If it goes below 0, that's another zero.
-        if position - distance < 0 and position != 0:
-            zeros += 1
-        position = (position - distance) % 100
-        # If it ends up on 0 after the modulo, add another zero.
-        if position == 0:
-            zeros += 1
-    else:
-        # If it goes above 99, that's another zero.
-        if position + distance > 99:  # noqa: PLR2004
-            zeros += 1
-        position = (position + distance) % 100
-    return position, zeros
+    for i in range(len(distances)):
+        distance = distances[i]
+        # Don't fall for its tricks! This has got to happen in the real input!
+        if distance == 0:
+            continue
+        # Anything over 100 is gravy. Only turn it by the modulo.
+        zeros += distance // 100
+        distance = distance % 100
+        if turns_left[i]:
+            # If it goes below 0, that's another zero.
+            if position - distance < 0 and position != 0:
+                zeros += 1
+            position = (position - distance) % 100
+            # If it ends up on 0 after the modulo, add another zero.
+            if position == 0:
+                zeros += 1
+        else:
+            # If it goes above 99, that's another zero.
+            if position + distance > 99:  # noqa: PLR2004
+                zeros += 1
+            position = (position + distance) % 100
+    return zeros
+
+
+def part2(rotations: tuple[list[bool], list[int]]) -> int:
+    """Count every click that leaves the dial pointing at 0."""
+    return int(count_zero_clicks(*rotations))
 
 
 def solve(input_data: str) -> tuple[int, int]:
@@ -87,35 +94,4 @@ def solve(input_data: str) -> tuple[int, int]:
     -------
         A tuple of (part1_result, part2_result)
     """
-    lines = input_data.strip().split("\n")
-
-    # Part 1
-    start_time = time.perf_counter()
-    position = 50
-    part1_zeros = 0
-
-    for line in lines:
-        direction, distance = line[0], int(line[1:])
-        position = turn(position, direction, distance)
-        if position == 0:
-            part1_zeros += 1
-
-    part1_result = part1_zeros
-    part1_time = time.perf_counter() - start_time
-    logger.info("Part 1: %s (%.4fs)", part1_result, part1_time)
-
-    # Part 2
-    start_time = time.perf_counter()
-    position = 50
-    part2_zeros = 0
-
-    for line in lines:
-        direction, distance = line[0], int(line[1:])
-        position, zeros = turn_part2(position, direction, distance)
-        part2_zeros += zeros
-
-    part2_result = part2_zeros
-    part2_time = time.perf_counter() - start_time
-    logger.info("Part 2: %s (%.4fs)", part2_result, part2_time)
-
-    return part1_result, part2_result
+    return run_parts(parse, part1, part2, input_data)
@@ -1,18 +1,46 @@
 """Advent of Code 2025 - Day 2."""
 
 import logging
-import time
-from math import ceil, floor
+from collections.abc import Iterator
+
+from advent_of_code.lib import extract_ints
+from advent_of_code.parts import run_parts
 
 
 logger = logging.getLogger(__name__)
 
 
+def repeated_ids(pattern_len: int, repeat: int) -> range:
+    """Get every ID made of a pattern of digits repeated a number of times.
+
+    Repeating a pattern multiplies it by a constant, e.g. 123123 is 123 * 1001, so
+    the IDs for a given pattern length and repeat count step evenly by that
+    constant from the smallest pattern to the largest.
+
+    Parameters
+    ----------
+    pattern_len: int
+        The number of digits in the pattern
+    repeat: int
+        The number of times the pattern is repeated
+
+    Returns
+    -------
+    range
+        The IDs, in ascending order
+    """
+    multiplier = (10 ** (pattern_len * repeat) - 1) // (10**pattern_len - 1)
+    return range(
+        10 ** (pattern_len - 1) * multiplier, 10**pattern_len * multiplier, multiplier
+    )
+
+
 class IDRange:
     """A class encapsulating the ranges for Day 2."""
 
-    def __init__(self, id_range_str: str) -> None:
-        self.start_id, self.end_id = (int(idx) for idx in id_range_str.split("-"))
+    def __init__(self, start_id: int, end_id: int) -> None:
+        self.start_id = start_id
+        self.end_id = end_id
 
     def __repr__(self) -> str:
         """Print out the qualities of the ID range."""
@@ -24,42 +52,28 @@ class IDRange:
             idx = int(idx)
         return idx in range(self.start_id, self.end_id + 1)
 
+    def repeated_ids(self, repeat: int) -> Iterator[int]:
+        """Get the IDs in this range made of a pattern repeated `repeat` times.
+
+        Only the IDs that fall in the range are visited, rather than every pattern
+        that could make one.
+        """
+        for id_len in range(len(str(self.start_id)), len(str(self.end_id)) + 1):
+            if id_len % repeat:
+                continue
+            ids = repeated_ids(id_len // repeat, repeat)
+            # Slice the IDs down to the ones between the start and end IDs
+            first = max(0, -(-(self.start_id - ids.start) // ids.step))
+            last = (self.end_id - ids.start) // ids.step + 1
+            yield from ids[first : max(first, last)]
+
     def invalid_ids(self) -> list[int]:
         """Get the list of invalid IDs for this range.
 
         An invalid ID is one in which the ID is composed of a sequence of numbers that
         repeat exactly twice.
         """
-        invalid_ids: list[int] = []
-
-        start_id_len = len(str(self.start_id))
-        end_id_len = len(str(self.end_id))
-
-        start_id = self.start_id
-        end_id = self.end_id
-
-        # If all IDs in range are an odd length, then all are valid
-        if start_id_len == end_id_len and start_id_len % 2 != 0:
-            return invalid_ids
-
-        # If the start ID length is odd, start at 1X where X is the number of zeros
-        if start_id_len == 1:
-            start_id = int("1" + ("0" * start_id_len))
-        if end_id_len % 2 != 0:
-            end_id = int("9" * (end_id_len - 1))
-
-        start_id_str = str(start_id)
-        start_id_half = int(start_id_str[: len(start_id_str) // 2])
-
-        end_id_str = str(end_id)
-        end_id_half = int(end_id_str[: len(end_id_str) // 2])
-
-        for idx in range(start_id_half, end_id_half + 1):
-            invalid_id = int(str(idx) * 2)
-            if invalid_id in self:
-                invalid_ids.append(invalid_id)
-
-        return invalid_ids
+        return list(self.repeated_ids(2))
 
     def invalid_ids_part2(self) -> list[int]:
         """Get the list of invalid IDs for Part 2 of Day 2.
@@ -68,46 +82,27 @@ class IDRange:
         - The ID is in the range.
         - The ID consists entirely of a part of the ID repeats any number of times.
         """
-        invalid_ids: list[int] = []
-
-        start_id = self.start_id
-        end_id = self.end_id
-        start_id_len = len(str(start_id))
-        end_id_len = len(str(end_id))
-
-        # If starting ID is only one digit, then bump it to 10
-        if len(str(self.start_id)) == 1:
-            start_id = 10
-
-        start_id_str = str(start_id)
-        start_id_half = int(start_id_str[: floor(len(start_id_str) // 2)])
-
-        end_id_str = str(end_id)
-        end_id_half = int(end_id_str[: ceil(len(end_id_str) / 2)])
-
-        repeat = 2
-        # Only check for repeats up to the length of the max ID
-        while repeat < (end_id_len + 1):
-            # Pattern must occur at least twice, so we can cut our search space to this
-            # range.
-            for idx in range(start_id_half, end_id_half + 1):
-                # Only check for this range of ID lengths
-                for id_len in range(start_id_len, end_id_len + 1):
-                    # Only check if a given ID length is a multiple of the repeat
-                    if id_len % repeat == 0:
-                        # See how long the pattern must be for this repeat and ID length
-                        pattern_len = id_len // repeat
-                        # Get the pattern from the ID
-                        pattern = str(idx)[:pattern_len]
-                        # Create the candidate ID
-                        candidate = int(pattern * repeat)
-                        # Only add the candidate if it's not already in the list
-                        # and is in the range
-                        if candidate not in invalid_ids and candidate in self:
-                            invalid_ids.append(int(candidate))
-            repeat += 1
-
-        return invalid_ids
+        # An ID such as 111111 repeats patterns of several lengths, so count it once
+        invalid_ids: set[int] = set()
+        for repeat in range(2, len(str(self.end_id)) + 1):
+            invalid_ids.update(self.repeated_ids(repeat))
+        return sorted(invalid_ids)
+
+
+def parse(input_data: str) -> list[IDRange]:
+    """Parse the comma-separated ID ranges."""
+    id_bounds = extract_ints(input_data).reshape(-1, 2).tolist()
+    return [IDRange(start_id, end_id) for start_id, end_id in id_bounds]
+
+
+def part1(id_ranges: list[IDRange]) -> int:
+    """Sum the IDs made of a sequence repeated exactly twice."""
+    return sum(sum(idr.invalid_ids()) for idr in id_ranges)
+
+
+def part2(id_ranges: list[IDRange]) -> int:
+    """Sum the IDs made of a sequence repeated any number of times."""
+    return sum(sum(idr.invalid_ids_part2()) for idr in id_ranges)
 
 
 def solve(input_data: str) -> tuple[int, int]:
@@ -124,29 +119,4 @@ def solve(input_data: str) -> tuple[int, int]:
     tuple[int, int]
         A tuple of (part1_result, part2_result)
     """
-    id_ranges_strs = input_data.strip().split(",")
-    id_ranges = [IDRange(idr) for idr in id_ranges_strs]
-
-    # Part 1
-    start_time = time.perf_counter()
-    sum_invalid_ids = 0
-    for idr in id_ranges:
-        invalid_id_list = idr.invalid_ids()
-        sum_invalid_ids += sum(invalid_id_list)
-
-    part1_result = sum_invalid_ids
-    part1_time = time.perf_counter() - start_time
-    logger.info("Part 1: %s (%.4fs)", part1_result, part1_time)
-
-    # Part 2
-    start_time = time.perf_counter()
-    sum_invalid_ids_part2 = 0
-    for idr in id_ranges:
-        invalid_id_list_part2 = idr.invalid_ids_part2()
-        sum_invalid_ids_part2 += sum(invalid_id_list_part2)
-
-    part2_result = sum_invalid_ids_part2
-    part2_time = time.perf_counter() - start_time
-    logger.info("Part 2: %s (%.4fs)", part2_result, part2_time)
-
-    return part1_result, part2_result
+    return run_parts(parse, part1, part2, input_data)
@@ -1,93 +1,141 @@
 """Advent of Code 2025 - Day 3."""
 
 import logging
-import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from advent_of_code.lib import Grid, kernel, memoize, split_lines
+from advent_of_code.parts import run_parts
 
 
 logger = logging.getLogger(__name__)
 
 
-class PowerBank:
-    """A class encapsulating the power bank for Day 3."""
-
-    def __init__(self, bank_str: str) -> None:
-        """Initialize the power bank."""
-        self.bank_str = bank_str
-
-    def __repr__(self) -> str:
-        """Print out the qualities of the power bank."""
-        return f"PowerBank(bank_str={self.bank_str})"
-
-    def max_joltage(self, num_batteries: int) -> int:
-        """Get the maximum joltage possible from the bank.
-
-        Parameters
-        ----------
-        num_batteries: int
-            The number of batteries to turn on
-
-        Returns
-        -------
-        int
-            The maximum joltage possible from the bank.
-        """
-        max_bank, _ = self._max_bank(
-            current_bank="",
-            remaining_bank=self.bank_str,
-            remaining_batteries=num_batteries,
-        )
-        return int(max_bank)
-
-    def _max_bank(
-        self, current_bank: str, remaining_bank: str, remaining_batteries: int
-    ) -> tuple[str, str]:
-        """Recursively get the max power bank consisting of N batteries.
-
-        The order in the bank must be respected.
-
-        Parameters
-        ----------
-        current_bank: str
-            The current bank of batteries as a single string
-        remaining_bank: str
-            The remaining bank of batteries as a single string
-        remaining_batteries: int
-            The number of batteries still needed
-
-        Returns
-        -------
-        tuple[str, str]
-            A tuple of (the current bank of batteries, the remaining bank of batteries)
-        """
-        # If no more batteries to collect, then we're done!
-        if remaining_batteries == 0:
-            return current_bank, remaining_bank
-
-        # Need to know the number of remaining batteries
-        bank_len = len(remaining_bank)
-        # Need to know the unique battery capacities
-        battery_set = set(remaining_bank)
-        # Initialize the index (start at the first one)
-        max_battery_index = 0
-        while True:
-            # Pick the largest capacity
-            max_battery = max(battery_set)
-            # Remove it from the pool
-            battery_set.remove(max_battery)
-            # Get the index of the first-occurring battery with this capacity
-            max_battery_index = remaining_bank.index(max_battery)
-            # As long as there are enough batteries following it, we want it!
-            if (bank_len - max_battery_index) >= remaining_batteries:
-                # Update the current bank, remaining bank, and
-                # number of batteries still needed, then call it again!
-                current_bank = current_bank + max_battery
-                remaining_bank = remaining_bank[max_battery_index + 1 :]
-                remaining_batteries -= 1
-                return self._max_bank(
-                    current_bank=current_bank,
-                    remaining_bank=remaining_bank,
-                    remaining_batteries=remaining_batteries,
-                )
+# The battery capacities, from the largest down
+CAPACITIES = np.arange(9, -1, -1)
+
+
+@dataclass(frozen=True, eq=False)
+class Banks:
+    """The parsed banks for Day 3.
+
+    Banks are compared and hashed by identity, so both parts of a solve can look
+    up the same memoized table for them.
+
+    Attributes
+    ----------
+    batteries: np.ndarray
+        The battery capacities, one bank per row
+    lengths: np.ndarray
+        The number of batteries in each bank, ignoring any padding
+    """
+
+    batteries: np.ndarray
+    lengths: np.ndarray
+
+
+@memoize(maxsize=8)
+def next_positions(banks: Banks) -> np.ndarray:
+    """Find the next battery of each capacity at or after every position.
+
+    Part 1 and Part 2 pick batteries from the same banks, so the table is built by
+    whichever part runs first and reused by the other.
+
+    Parameters
+    ----------
+    banks: Banks
+        The parsed banks
+
+    Returns
+    -------
+    np.ndarray
+        At ``[bank, position, 9 - capacity]``, the index of the first battery of
+        that capacity at or after the position, or the width of the grid if none
+    """
+    width = banks.batteries.shape[1]
+    positions = np.where(
+        banks.batteries[:, :, np.newaxis] == CAPACITIES,
+        np.arange(width)[:, np.newaxis],
+        width,
+    )
+    table = np.minimum.accumulate(positions[:, ::-1], axis=1)[:, ::-1]
+    # The table is shared between the parts, so it must not be changed
+    table.flags.writeable = False
+    return table
+
+
+def pick_in_lockstep(
+    next_table: np.ndarray, bank_lengths: np.ndarray, num_batteries: int
+) -> int:
+    """Make each greedy pick for every bank at once, rather than bank by bank."""
+    banks = np.arange(len(bank_lengths))
+    starts = np.zeros(len(bank_lengths), dtype=np.intp)
+    joltages = np.zeros(len(bank_lengths), dtype=np.int64)
+    for remaining in range(num_batteries, 0, -1):
+        candidates = next_table[banks, starts]
+        # The largest capacity that still leaves enough batteries after it
+        fits = candidates <= (bank_lengths - remaining)[:, np.newaxis]
+        choices = fits.argmax(axis=1)
+        joltages = joltages * 10 + CAPACITIES[choices]
+        starts = candidates[banks, choices] + 1
+    return int(joltages.sum())
+
+
+@kernel(fallback=pick_in_lockstep)
+def total_max_joltage(
+    next_table: np.ndarray, bank_lengths: np.ndarray, num_batteries: int
+) -> int:
+    """Greedily pick the maximum joltage of every bank and sum them.
+
+    Each pick is the first largest battery that still leaves enough batteries
+    after it, which is the same choice `advent_of_code.oracles.PowerBank` makes.
+    The table from `next_positions` finds it without rescanning the bank.
+
+    Parameters
+    ----------
+    next_table: np.ndarray
+        The table of next positions from `next_positions`
+    bank_lengths: np.ndarray
+        The number of batteries in each bank, ignoring any padding
+    num_batteries: int
+        The number of batteries to turn on in each bank
+
+    Returns
+    -------
+    int
+        The sum of the maximum joltages
+    """
+    total = 0
+    for bank_index in range(len(bank_lengths)):
+        start = 0
+        joltage = 0
+        for remaining in range(num_batteries, 0, -1):
+            last = bank_lengths[bank_index] - remaining
+            choice = 0
+            while next_table[bank_index, start, choice] > last:
+                choice += 1
+            joltage = joltage * 10 + 9 - choice
+            start = next_table[bank_index, start, choice] + 1
+        total += joltage
+    return total
+
+
+def parse(input_data: str) -> Banks:
+    """Parse the banks into a grid of capacities and the length of each bank."""
+    bank_strs = split_lines(input_data)
+    bank_lengths = np.array([len(bank_str) for bank_str in bank_strs])
+    return Banks(Grid.from_lines(bank_strs).digits(), bank_lengths)
+
+
+def part1(banks: Banks) -> int:
+    """Sum the maximum joltage of each bank with two batteries on."""
+    return int(total_max_joltage(next_positions(banks), banks.lengths, 2))
+
+
+def part2(banks: Banks) -> int:
+    """Sum the maximum joltage of each bank with twelve batteries on."""
+    return int(total_max_joltage(next_positions(banks), banks.lengths, 12))
 
 
 def solve(input_data: str) -> tuple[int, int]:
@@ -104,24 +152,4 @@ def solve(input_data: str) -> tuple[int, int]:
     tuple[int, int]
         A tuple of (part1_result, part2_result)
     """
-    lines = input_data.strip().split("\n")
-
-    power_banks = [PowerBank(bank_str) for bank_str in lines]
-
-    start_time = time.perf_counter()
-    max_joltages = [
-        power_bank.max_joltage(num_batteries=2) for power_bank in power_banks
-    ]
-    part1_result = sum(max_joltages)
-    part1_time = time.perf_counter() - start_time
-    logger.info("Part 1: %s (%.4fs)", part1_result, part1_time)
-
-    start_time = time.perf_counter()
-    max_joltages = [
-        power_bank.max_joltage(num_batteries=12) for power_bank in power_banks
-    ]
-    part2_result = sum(max_joltages)
-    part2_time = time.perf_counter() - start_time
-    logger.info("Part 2: %s (%.4fs)", part2_result, part2_time)
-
-    return part1_result, part2_result
+    return run_parts(parse, part1, part2, input_data)
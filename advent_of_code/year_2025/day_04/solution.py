@@ -1,67 +1,139 @@
 """Advent of Code 2025 - Day 4."""
 
 import logging
-import time
 
-import networkx as nx
+import numpy as np
+
+from advent_of_code.lib import Grid, kernel, neighbour_counts
+from advent_of_code.parts import run_parts
 
 
 logger = logging.getLogger(__name__)
 
 
-def create_nodes(grid: list[str]) -> nx.Graph:
-    """Create the paper graph."""
-    g = nx.Graph()
-    for i in range(len(grid)):
-        for j in range(len(grid[0])):
-            if grid[i][j] == "@":
-                g.add_node((i, j))
+# A roll of paper can be moved if fewer than this many rolls surround it
+MAX_NEIGHBORS = 4
 
-    return g
 
+def movable(rolls: np.ndarray) -> np.ndarray:
+    """Find the rolls of paper with fewer than four neighbors.
 
-def create_edges(g: nx.Graph) -> None:
-    """Make connections."""
-    for node in g:
-        for i in (-1, 0, 1):
-            for j in (-1, 0, 1):
-                check_node = (node[0] + i, node[1] + j)
-                if (
-                    node != check_node
-                    and check_node[0] >= 0
-                    and check_node[1] >= 0
-                    and check_node in g.nodes
-                ):
-                    g.add_edge(node, check_node)
+    Parameters
+    ----------
+    rolls: np.ndarray
+        A 2-D boolean mask of where the rolls of paper are
+
+    Returns
+    -------
+    np.ndarray
+        A 2-D boolean mask of the rolls that can be moved
+    """
+    return rolls & (neighbour_counts(rolls) < MAX_NEIGHBORS)
 
 
-def part_1(g: nx.Graph) -> int:
+def count_movable(grid: Grid) -> int:
     """Calculate how many rolls of paper have fewer than four neighbors."""
-    num_movable = 0
-    for node in g:
-        if len(list(g.neighbors(node))) < 4:  # noqa: PLR2004
-            num_movable += 1
-    return num_movable
+    return int(np.count_nonzero(movable(grid.mask("@"))))
 
 
-def part_2(g: nx.Graph) -> int:
-    """Remove rolls of paper until no rolls can be removed."""
+def remove_in_rounds(rolls: np.ndarray, counts: np.ndarray) -> int:
+    """Remove rolls of paper in rounds until no rolls can be removed.
+
+    Every round removes all the movable rolls at once, exactly like the graph
+    version in `advent_of_code.oracles` does, but applies the neighbor kernel to the
+    whole grid per round.
+
+    Parameters
+    ----------
+    rolls: np.ndarray
+        A 2-D boolean mask of where the rolls of paper are
+    counts: np.ndarray
+        The number of rolls next to each cell
+
+    Returns
+    -------
+    int
+        The number of rolls removed
+    """
+    rolls = rolls.copy()
+    removable = rolls & (counts < MAX_NEIGHBORS)
     num_removed = 0
     while True:
-        iter_removed = 0
-        g_copy = g.copy()
-        for node in g:
-            if len(list(g.neighbors(node))) < 4:  # noqa: PLR2004
-                num_removed += 1
-                iter_removed += 1
-                g_copy.remove_node(node)
+        iter_removed = int(np.count_nonzero(removable))
         # Stop once we cycle through and remove no rolls.
         if iter_removed == 0:
             break
-        g = g_copy
+        num_removed += iter_removed
+        rolls &= ~removable
+        removable = movable(rolls)
     return num_removed
 
 
+@kernel(fallback=remove_in_rounds)
+def peel_rolls(rolls: np.ndarray, counts: np.ndarray) -> int:
+    """Remove rolls of paper one at a time from a queue of movable rolls.
+
+    Removing a roll only changes its neighbors, so only they are re-checked.
+    The rolls left at the end are the same whatever the order of removal, so this
+    removes as many as the rounds of `remove_in_rounds` do.
+
+    Parameters
+    ----------
+    rolls: np.ndarray
+        A 2-D boolean mask of where the rolls of paper are
+    counts: np.ndarray
+        The number of rolls next to each cell
+
+    Returns
+    -------
+    int
+        The number of rolls removed
+    """
+    rows, cols = rolls.shape
+    present = rolls.copy()
+    counts = counts.copy()
+    queued = present & (counts < MAX_NEIGHBORS)
+    queue = np.flatnonzero(queued)
+    queue = np.concatenate((queue, np.empty(rows * cols - len(queue), np.int64)))
+    head = 0
+    tail = int(np.count_nonzero(queued))
+
+    while head < tail:
+        i, j = divmod(queue[head], cols)
+        head += 1
+        present[i, j] = False
+        for ni in range(max(i - 1, 0), min(i + 2, rows)):
+            for nj in range(max(j - 1, 0), min(j + 2, cols)):
+                if present[ni, nj] and not queued[ni, nj]:
+                    counts[ni, nj] -= 1
+                    if counts[ni, nj] < MAX_NEIGHBORS:
+                        queued[ni, nj] = True
+                        queue[tail] = ni * cols + nj
+                        tail += 1
+    return head
+
+
+def count_removable(grid: Grid) -> int:
+    """Remove rolls of paper until no rolls can be removed."""
+    rolls = grid.mask("@")
+    return int(peel_rolls(rolls, neighbour_counts(rolls)))
+
+
+def parse(input_data: str) -> Grid:
+    """Parse the grid of paper rolls."""
+    return Grid.from_text(input_data)
+
+
+def part1(grid: Grid) -> int:
+    """Perform part 1 of the challenge."""
+    return count_movable(grid)
+
+
+def part2(grid: Grid) -> int:
+    """Perform part 2 of the challenge."""
+    return count_removable(grid)
+
+
 def solve(input_data: str) -> tuple[int, int]:
     """
     Solve the Advent of Code challenge.
@@ -76,22 +148,4 @@ def solve(input_data: str) -> tuple[int, int]:
     tuple[int, int]
         A tuple of (part1_result, part2_result)
     """
-    lines = input_data.strip().split("\n")
-
-    # Part 1:
-    start_time = time.perf_counter()
-    g = create_nodes(lines)
-    create_edges(g)
-    part1_result = part_1(g)
-    part1_time = time.perf_counter() - start_time
-    logger.info("Part 1: %s (%.4fs)", part1_result, part1_time)
-
-    # Part 2:
-    start_time = time.perf_counter()
-    g = create_nodes(lines)
-    create_edges(g)
-    part2_result = part_2(g)
-    part2_time = time.perf_counter() - start_time
-    logger.info("Part 2: %s (%.4fs)", part2_result, part2_time)
-
-    return part1_result, part2_result
+    return run_parts(parse, part1, part2, input_data)
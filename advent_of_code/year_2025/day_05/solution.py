@@ -1,30 +1,47 @@
 """Advent of Code 2025 - Day 5."""
 
 import logging
-import time
+
+import numpy as np
+
+from advent_of_code.lib import IntervalSet, extract_ints
+from advent_of_code.parts import run_parts
 
 
 logger = logging.getLogger(__name__)
 
 
-class IDRange:
-    """A range of IDs."""
+def parse(input_data: str) -> tuple[IntervalSet, np.ndarray]:
+    """Parse the fresh ID ranges and the available IDs.
+
+    Parameters
+    ----------
+    input_data: str
+        The input data as a string
+
+    Returns
+    -------
+    tuple[IntervalSet, np.ndarray]
+        The merged fresh ID ranges and the available IDs
+    """
+    ranges_text, _, ids_text = input_data.strip().partition("\n\n")
+    bounds = extract_ints(ranges_text)
+    if len(bounds) != 2 * len(ranges_text.split()):
+        msg = f"Expected N-N for every range. Got {ranges_text!r}."
+        raise ValueError(msg)
+    return IntervalSet.from_pairs(bounds), extract_ints(ids_text)
+
 
-    def __init__(self, range_str: str) -> None:
-        range_vals = range_str.split("-")
-        if len(range_vals) != 2:  # noqa: PLR2004
-            msg = f"Expected N-N for range. Got {range_str}."
-            raise ValueError(msg)
-        self.beginning = int(range_vals[0])
-        self.end = int(range_vals[1])
+def part1(inventory: tuple[IntervalSet, np.ndarray]) -> int:
+    """Count the available IDs that are FRESH."""
+    fresh_ranges, id_list = inventory
+    return int(np.count_nonzero(fresh_ranges.contains(id_list)))
 
-    def __contains__(self, idx: int) -> bool:
-        """Is the ID FRESH."""
-        return self.beginning <= idx <= self.end
 
-    def __len__(self) -> int:
-        """Get the inclusive length of the range."""
-        return self.end - self.beginning + 1
+def part2(inventory: tuple[IntervalSet, np.ndarray]) -> int:
+    """Count every ID the fresh ranges consider FRESH."""
+    fresh_ranges, _ = inventory
+    return len(fresh_ranges)
 
 
 def solve(input_data: str) -> tuple[int, int]:
@@ -41,50 +58,4 @@ def solve(input_data: str) -> tuple[int, int]:
     tuple[int, int]
         A tuple of (part1_result, part2_result)
     """
-    lines = input_data.strip().split("\n")
-    id_ranges = [IDRange(s) for s in lines if "-" in s]
-    id_list = [int(s) for s in lines if len(s) > 0 and "-" not in s]
-
-    # Part 1: Your solution here
-    start_time = time.perf_counter()
-    fresh_count = 0
-    for idx in id_list:
-        for idr in id_ranges:
-            if idx in idr:
-                fresh_count += 1
-                break
-
-    part1_result = fresh_count
-    part1_time = time.perf_counter() - start_time
-    logger.info("Part 1: %s (%.4fs)", part1_result, part1_time)
-
-    # Part 2: Your solution here
-    start_time = time.perf_counter()
-    id_ranges = sorted(id_ranges, key=lambda idr: idr.beginning)
-    fresh_count = 0
-    last_interval = None
-    for idr in id_ranges:
-        # First IDR
-        if last_interval is None:
-            fresh_count += len(idr)
-            last_interval = idr
-
-        # If disjoint
-        elif idr.beginning > last_interval.end:
-            fresh_count += len(idr)
-
-        # Any overlap
-        elif idr.beginning <= last_interval.end:
-            # Only add new values
-            if idr.end > last_interval.end:
-                fresh_count += idr.end - last_interval.end
-            else:
-                continue
-
-        last_interval = idr
-
-    part2_result = fresh_count
-    part2_time = time.perf_counter() - start_time
-    logger.info("Part 2: %s (%.4fs)", part2_result, part2_time)
-
-    return part1_result, part2_result
+    return run_parts(parse, part1, part2, input_data)
@@ -1,64 +1,358 @@
 """Advent of Code 2025 - Day 6."""
 
 import logging
-import time
-from functools import reduce
-from operator import add, mul
+import mmap
+import os
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import pairwise
+from math import prod
+from pathlib import Path
+
+import numpy as np
+
+from advent_of_code.lib import Grid
+from advent_of_code.parts import run_parts
 
 
 logger = logging.getLogger(__name__)
 
+SPACE = ord(" ")
+ZERO = ord("0")
+NINE = ord("9")
+OPERATORS = {ord("+"): "+", ord("*"): "*"}
+# Worksheets with at least this many problems are evaluated in a process pool
+PARALLEL_MIN_PROBLEMS = 100_000
+# Hand each worker several chunks so uneven big-int products balance out
+CHUNKS_PER_WORKER = 4
+# Below this many values a plain left fold is cheaper than building a product tree
+PRODUCT_TREE_MIN_VALUES = 8
+# Initial number of columns per row held in memory when streaming a worksheet
+STREAM_WINDOW = 1 << 16
+# Operands with more digits than this could overflow int64, so are read exactly
+MAX_INT64_DIGITS = 18
 
-def part1(lines: list[str]) -> int:
-    """Perform part 1 of the challenge."""
-    part1_result = 0
-    rank = len(lines)
-    operands = []
-    operators = []
-    operator_functions = []
-    for ix, line in enumerate(lines):
-        line = " ".join(line.split())  # noqa: PLW2901
-        if ix + 1 == rank:
-            operators = line.split(" ")
-            for operator in operators:
-                if operator == "+":
-                    operator_functions.append(add)
-                elif operator == "*":
-                    operator_functions.append(mul)
+
+def separator_columns(grid: np.ndarray) -> np.ndarray:
+    """Flag the columns of a character matrix that are entirely spaces."""
+    return (grid == SPACE).all(axis=0)
+
+
+class Worksheet:
+    """The math worksheet for Day 6, loaded as a 2-D character matrix.
+
+    Each problem is a block of columns bounded by columns that are entirely spaces.
+    The last row holds the operator of each problem, and the rows above it hold the
+    digits of its operands.
+    """
+
+    def __init__(self, grid: np.ndarray) -> None:
+        """Locate the problem blocks in a 2-D uint8 character matrix."""
+        self.grid = grid
+        width = grid.shape[1]
+
+        # Blocks are the runs of columns between separator columns
+        separators = separator_columns(grid)
+        edges = np.diff((~separators).astype(np.int8), prepend=0, append=0)
+        self.block_starts = np.flatnonzero(edges == 1)
+        self.block_ends = np.flatnonzero(edges == -1)
+        # The block each column belongs to (separator columns are never read)
+        self.column_blocks = (
+            np.searchsorted(self.block_starts, np.arange(width), side="right") - 1
+        )
+
+        digits = self.grid[:-1]
+        self.is_digit = (digits >= ZERO) & (digits <= NINE)
+        self.digit_values = np.where(self.is_digit, digits - ZERO, 0).astype(np.int64)
+
+        # Each block has a single operator, and both outrank a space
+        operator_codes = (
+            np.maximum.reduceat(self.grid[-1], self.block_starts)
+            if len(self.block_starts)
+            else np.empty(0, dtype=np.uint8)
+        )
+        try:
+            self.operators = [OPERATORS[code] for code in operator_codes.tolist()]
+        except KeyError as exc:
+            msg = f"Expected + or * for every problem. Got {chr(exc.args[0])!r}."
+            raise ValueError(msg) from exc
+
+    @classmethod
+    def from_lines(cls, lines: list[str]) -> "Worksheet":
+        """Load the worksheet from its lines, padding them to a common width."""
+        return cls(Grid.from_lines(lines).cells)
+
+    def __len__(self) -> int:
+        """Get the number of problems on the worksheet."""
+        return len(self.block_starts)
+
+    def _place_values(self, digits_after: np.ndarray) -> np.ndarray:
+        """Scale each digit by ten to the power of the digits following it."""
+        exponents = np.where(self.is_digit, digits_after, 0)
+        return self.digit_values * np.power(10, exponents, dtype=np.int64)
+
+    @staticmethod
+    def _exact_number(cells: np.ndarray, is_digit: np.ndarray) -> int:
+        """Read the digits among some cells as a Python int, which cannot overflow."""
+        return int(cells[is_digit].tobytes() or b"0")
+
+    def row_numbers(self) -> list[list[int]]:
+        """Get the operands of each problem read across its rows (Part 1).
+
+        Returns
+        -------
+        list[list[int]]
+            The operands of each problem, one per digit row
+        """
+        if not len(self):
+            return []
+        # Count the digits to the right of each cell within its block
+        digit_counts = np.cumsum(self.is_digit, axis=1)
+        block_totals = digit_counts[:, self.block_ends - 1]
+        digits_after: np.ndarray = block_totals[:, self.column_blocks] - digit_counts
+        numbers = np.add.reduceat(
+            self._place_values(digits_after), self.block_starts, axis=1
+        )
+
+        # Rebuild the operands of blocks too wide for int64 from their digits
+        block_digits = np.add.reduceat(
+            self.is_digit.astype(np.int64), self.block_starts, axis=1
+        )
+        wide_blocks = np.flatnonzero((block_digits > MAX_INT64_DIGITS).any(axis=0))
+        if len(wide_blocks):
+            numbers = numbers.astype(object)
+            for block in wide_blocks.tolist():
+                columns = slice(self.block_starts[block], self.block_ends[block])
+                for row in range(numbers.shape[0]):
+                    numbers[row, block] = self._exact_number(
+                        self.grid[row, columns], self.is_digit[row, columns]
+                    )
+        return np.ascontiguousarray(numbers.T).tolist()
+
+    def column_numbers(self) -> list[list[int]]:
+        """Get the operands of each problem read down its columns (Part 2).
+
+        Returns
+        -------
+        list[list[int]]
+            The operands of each problem, one per column that holds digits
+        """
+        if not len(self):
+            return []
+        # Count the digits below each cell within its column
+        digit_counts = np.cumsum(self.is_digit, axis=0)
+        column_totals = digit_counts[-1]
+        digits_after = column_totals - digit_counts
+        numbers = self._place_values(digits_after).sum(axis=0)
+
+        # Rebuild the operands of columns too tall for int64 from their digits
+        wide_columns = np.flatnonzero(column_totals > MAX_INT64_DIGITS)
+        if len(wide_columns):
+            numbers = numbers.astype(object)
+            for column in wide_columns.tolist():
+                numbers[column] = self._exact_number(
+                    self.grid[:-1, column], self.is_digit[:, column]
+                )
+
+        number_columns = column_totals > 0
+        blocks = self.column_blocks[number_columns]
+        bounds = np.searchsorted(blocks, np.arange(len(self) + 1)).tolist()
+        operands = numbers[number_columns].tolist()
+        return [operands[start:end] for start, end in pairwise(bounds)]
+
+
+def product_tree(values: Sequence[int]) -> int:
+    """Multiply the values pairwise in a balanced tree.
+
+    A left fold multiplies an ever-growing product by one small value at a time.
+    Pairing the values up keeps both sides of each multiplication a similar size,
+    which is where big-int multiplication is cheapest per digit.
+
+    Parameters
+    ----------
+    values: Sequence[int]
+        The values to multiply
+
+    Returns
+    -------
+    int
+        The product of the values (1 if there are none)
+    """
+    if len(values) <= PRODUCT_TREE_MIN_VALUES:
+        return prod(values)
+    level = list(values)
+    while len(level) > 1:
+        paired = [level[i] * level[i + 1] for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0]
+
+
+def _evaluate_chunk(operators: list[str], problems: list[list[int]]) -> int:
+    """Sum the answers to a run of problems."""
+    return sum(
+        product_tree(operands) if operator == "*" else sum(operands)
+        for operator, operands in zip(operators, problems, strict=True)
+    )
+
+
+def evaluate(
+    operators: list[str], problems: list[list[int]], workers: int | None = None
+) -> int:
+    """Sum the answers to every problem on the worksheet.
+
+    Problems are independent, so with more than one worker the problem blocks are
+    split into contiguous chunks, evaluated in a process pool, and the partial
+    totals summed.
+
+    Parameters
+    ----------
+    operators: list[str]
+        The operator of each problem
+    problems: list[list[int]]
+        The operands of each problem
+    workers: int | None
+        The number of worker processes. Defaults to one per CPU for worksheets with
+        at least `PARALLEL_MIN_PROBLEMS` problems, and to serial otherwise.
+
+    Returns
+    -------
+    int
+        The grand total of the worksheet
+    """
+    if workers is None:
+        parallel = len(problems) >= PARALLEL_MIN_PROBLEMS
+        workers = (os.cpu_count() or 1) if parallel else 1
+    if workers <= 1:
+        return _evaluate_chunk(operators, problems)
+
+    chunk_size = -(-len(problems) // (workers * CHUNKS_PER_WORKER))
+    bounds = range(0, len(problems), chunk_size)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        partials = executor.map(
+            _evaluate_chunk,
+            [operators[start : start + chunk_size] for start in bounds],
+            [problems[start : start + chunk_size] for start in bounds],
+        )
+        return sum(partials)
+
+
+def _row_spans(buffer: mmap.mmap) -> list[tuple[int, int]]:
+    """Get the (start, end) byte offsets of each line of the worksheet."""
+    spans = []
+    start = 0
+    while start < len(buffer):
+        end = buffer.find(b"\n", start)
+        if end == -1:
+            end = len(buffer)
+        spans.append((start, end))
+        start = end + 1
+    # Match the runner, which strips trailing newlines from the input
+    while spans and spans[-1][0] == spans[-1][1]:
+        spans.pop()
+    return spans
+
+
+def stream_problems(
+    input_file: Path, window: int = STREAM_WINDOW
+) -> Iterator[tuple[str, list[int], list[int]]]:
+    """Stream the problems of a worksheet file without loading it whole.
+
+    The file is memory-mapped and read through a column window shared by every row.
+    Problems are emitted as soon as a separator column closes them, and the window
+    then moves up to the first unfinished column. A problem wider than the window
+    doubles it, so memory stays bounded by the widest problem rather than the
+    worksheet.
+
+    Parameters
+    ----------
+    input_file: Path
+        The worksheet file
+    window: int
+        The initial number of columns per row to hold at a time
+
+    Yields
+    ------
+    tuple[str, list[int], list[int]]
+        The operator, row-wise operands (Part 1) and column-wise operands (Part 2)
+        of each problem, from left to right
+    """
+    with input_file.open("rb") as f:
+        # An empty file cannot be memory-mapped, and has no problems anyway
+        if not os.fstat(f.fileno()).st_size:
+            return
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    with buffer:
+        spans = _row_spans(buffer)
+        width = max((end - start for start, end in spans), default=0)
+
+        column = 0
+        while column < width:
+            stop = min(column + window, width)
+            grid = np.full((len(spans), stop - column), SPACE, dtype=np.uint8)
+            for row, (start, end) in enumerate(spans):
+                chunk = buffer[start + column : min(end, start + stop)]
+                grid[row, : len(chunk)] = np.frombuffer(chunk, dtype=np.uint8)
+
+            # Only a separator column proves that the problems before it are done
+            cut = grid.shape[1]
+            if stop < width:
+                separators = np.flatnonzero(separator_columns(grid))
+                if not len(separators):
+                    window *= 2
+                    continue
+                cut = int(separators[-1]) + 1
+
+            worksheet = Worksheet(grid[:, :cut])
+            yield from zip(
+                worksheet.operators,
+                worksheet.row_numbers(),
+                worksheet.column_numbers(),
+                strict=True,
+            )
+            column += cut
+
+
+def stream_solve(input_file: Path, window: int = STREAM_WINDOW) -> tuple[int, int]:
+    """Solve both parts from a worksheet file in bounded memory.
+
+    Parameters
+    ----------
+    input_file: Path
+        The worksheet file
+    window: int
+        The initial number of columns per row to hold at a time
+
+    Returns
+    -------
+    tuple[int, int]
+        A tuple of (part1_result, part2_result)
+    """
+    part1_result = part2_result = 0
+    for operator, rows, columns in stream_problems(input_file, window=window):
+        if operator == "*":
+            part1_result += product_tree(rows)
+            part2_result += product_tree(columns)
         else:
-            operands.append([int(s) for s in line.split(" ")])
-    for i in range(len(operators)):
-        part1_result += reduce(operator_functions[i], [int(o[i]) for o in operands])
-    return part1_result
+            part1_result += sum(rows)
+            part2_result += sum(columns)
+    return part1_result, part2_result
 
 
-def part2(lines: list[str]) -> int:
+def part1(worksheet: Worksheet, workers: int | None = None) -> int:
     """Perform part 1 of the challenge."""
-    part2_result = 0
-    file = len(lines[0])
-
-    nums: list[int] = []
-    op = None
-    for i in range(file):
-        if all(line[i] == " " for line in lines):
-            if op is None:
-                msg = "op is None!"
-                raise ValueError(msg)
-            part2_result += reduce(op, nums)
-            nums = []
-            op = None
-        else:
-            op_str = lines[-1][i]
-            if op_str == "+":
-                op = add
-            elif op_str == "*":
-                op = mul
-            num_str_list = [line[i] for line in lines[:-1]]
-            num_str = "".join(num_str_list)
-            nums.append(int(num_str.strip()))
-    if op is not None:
-        part2_result += reduce(op, nums)
-    return part2_result
+    return evaluate(worksheet.operators, worksheet.row_numbers(), workers=workers)
+
+
+def part2(worksheet: Worksheet, workers: int | None = None) -> int:
+    """Perform part 2 of the challenge."""
+    return evaluate(worksheet.operators, worksheet.column_numbers(), workers=workers)
+
+
+def parse(input_data: str) -> Worksheet:
+    """Load the worksheet."""
+    return Worksheet.from_lines(input_data.split("\n"))
 
 
 def solve(input_data: str) -> tuple[int, int]:
@@ -75,18 +369,4 @@ def solve(input_data: str) -> tuple[int, int]:
     tuple[int, int]
         A tuple of (part1_result, part2_result)
     """
-    # Part 1: Your solution here
-    start_time = time.perf_counter()
-    lines = input_data.split("\n")
-    part1_result = part1(lines)
-    part1_time = time.perf_counter() - start_time
-    logger.info("Part 1: %s (%.4fs)", part1_result, part1_time)
-
-    # Part 2: Your solution here
-    start_time = time.perf_counter()
-    lines = input_data.split("\n")
-    part2_result = part2(lines)
-    part2_time = time.perf_counter() - start_time
-    logger.info("Part 2: %s (%.4fs)", part2_result, part2_time)
-
-    return part1_result, part2_result
+    return run_parts(parse, part1, part2, input_data)
@@ -0,0 +1,33 @@
+from pathlib import Path
+
+import pytest
+
+from advent_of_code.batch import run_batch
+from advent_of_code.runner import build_parser, check_arguments
+
+
+DAY_05 = "advent_of_code.year_2025.day_05.solution"
+EXAMPLE = "3-5\n10-14\n16-20\n12-18\n\n1\n5\n8\n11\n17\n32"
+
+
+def test_unreadable_input_fails_only_its_row(tmp_path: Path) -> None:
+    (tmp_path / "a.txt").write_text(EXAMPLE)
+    (tmp_path / "b.txt").write_bytes(b"3-5\xff\n\n4")
+    (tmp_path / "c.txt").write_text(EXAMPLE)
+    files = sorted(tmp_path.iterdir())
+
+    first, unreadable, last = run_batch(DAY_05, files, max_workers=1)
+
+    assert first.result == last.result == (3, 14)
+    assert unreadable.result is None
+    assert not unreadable.succeeded
+    assert unreadable.error is not None
+    assert unreadable.error.startswith("UnicodeDecodeError")
+
+
+def test_inputs_rejects_stats(tmp_path: Path) -> None:
+    parser = build_parser()
+    args = parser.parse_args(["2025", "5", "--inputs", str(tmp_path), "--stats"])
+
+    with pytest.raises(SystemExit):
+        check_arguments(parser, args)
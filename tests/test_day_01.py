@@ -0,0 +1,23 @@
+import subprocess
+import sys
+
+from advent_of_code.year_2025.day_01 import solution as day_01
+
+
+EXAMPLE = "L68\nL30\nR48\nL5\nR60\nL55\nL1\nL99\nR14\nL82"
+
+
+def test_example() -> None:
+    assert day_01.solve(EXAMPLE) == (3, 6)
+
+
+def test_solve_never_imports_numpy() -> None:
+    # NumPy takes longer to import than day 1 takes to solve
+    script = (
+        "import sys\n"
+        "from advent_of_code.year_2025.day_01 import solution\n"
+        f"solution.solve({EXAMPLE!r})\n"
+        "sys.exit('numpy' in sys.modules)\n"
+    )
+
+    subprocess.run([sys.executable, "-c", script], check=True)  # noqa: S603
@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+from advent_of_code.year_2025.day_02 import solution as day_02
+
+
+EXAMPLE = (
+    "11-22,95-115,998-1012,1188511880-1188511890,222220-222224,1698522-1698528,"
+    "446443-446449,38593856-38593862,565653-565659,824824821-824824827,"
+    "2121212118-2121212124"
+)
+
+
+def repeats(idx: int, repeat: int) -> bool:
+    """Check whether an ID is a pattern repeated exactly `repeat` times."""
+    digits = str(idx)
+    pattern_len, remainder = divmod(len(digits), repeat)
+    return not remainder and digits[:pattern_len] * repeat == digits
+
+
+def brute_force(start_id: int, end_id: int) -> tuple[list[int], list[int]]:
+    """Check every ID in the range against both rules."""
+    ids = range(start_id, end_id + 1)
+    twice = [idx for idx in ids if repeats(idx, 2)]
+    any_times = [
+        idx for idx in ids if any(repeats(idx, n) for n in range(2, len(str(idx)) + 1))
+    ]
+    return twice, any_times
+
+
+def test_example() -> None:
+    assert day_02.solve(EXAMPLE) == (1227775554, 4174379265)
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_matches_brute_force(seed: int) -> None:
+    rng = random.Random(seed)
+    start_id = rng.randint(1, 10 ** rng.randint(1, 7))
+    end_id = start_id + rng.randint(0, 10 ** rng.randint(1, 4))
+    id_range = day_02.IDRange(start_id, end_id)
+
+    twice, any_times = brute_force(start_id, end_id)
+
+    assert id_range.invalid_ids() == twice
+    assert id_range.invalid_ids_part2() == any_times
+
+
+def test_range_spanning_id_lengths() -> None:
+    # 222 is a three-digit ID inside a range from two to four digits
+    id_range = day_02.IDRange(39, 1033)
+
+    assert 222 in id_range.invalid_ids_part2()
+    assert id_range.invalid_ids_part2() == brute_force(39, 1033)[1]
@@ -0,0 +1,63 @@
+import random
+
+import numpy as np
+import pytest
+
+from advent_of_code import oracles
+from advent_of_code.lib.memo import cache_stats, reset_caches
+from advent_of_code.year_2025.day_03 import solution as day_03
+
+
+EXAMPLE = "987654321111111\n811111111111119\n234234234234278\n818181911112111"
+
+
+def random_banks(rng: random.Random) -> str:
+    """Make banks of ragged lengths, each long enough for twelve batteries."""
+    return "\n".join(
+        "".join(rng.choice("123456789") for _ in range(rng.randint(12, 40)))
+        for _ in range(rng.randint(1, 20))
+    )
+
+
+def test_example() -> None:
+    assert day_03.solve(EXAMPLE) == (357, 3121910778619)
+
+
+@pytest.mark.parametrize("num_batteries", [1, 2, 12])
+@pytest.mark.parametrize("seed", range(30))
+def test_picks_match_oracle(seed: int, num_batteries: int) -> None:
+    input_data = random_banks(random.Random(seed))
+    banks = day_03.parse(input_data)
+    next_table = day_03.next_positions(banks)
+    expected = oracles.max_joltage_sum(input_data, num_batteries=num_batteries)
+
+    # The kernel is only compiled with AOC_JIT=1, so also run it interpreted
+    assert day_03.total_max_joltage.func(next_table, banks.lengths, num_batteries) == (
+        expected
+    )
+    assert day_03.pick_in_lockstep(next_table, banks.lengths, num_batteries) == (
+        expected
+    )
+
+
+def test_parts_share_next_positions() -> None:
+    reset_caches()
+    banks = day_03.parse(EXAMPLE)
+
+    day_03.part1(banks)
+    day_03.part2(banks)
+
+    (stats,) = cache_stats()
+    assert stats.name.endswith("next_positions")
+    assert (stats.hits, stats.misses) == (1, 1)
+    assert not day_03.next_positions(banks).flags.writeable
+
+
+def test_next_positions() -> None:
+    banks = day_03.parse("919\n11")
+    table = day_03.next_positions(banks)
+
+    # The first 9 at or after each position, then the first 1
+    np.testing.assert_array_equal(table[0, :, 0], [0, 2, 2])
+    np.testing.assert_array_equal(table[0, :, 8], [1, 1, 3])
+    np.testing.assert_array_equal(table[1, :, 8], [0, 1, 3])
@@ -0,0 +1,65 @@
+import random
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+
+from advent_of_code import oracles
+from advent_of_code.lib import neighbour_counts
+from advent_of_code.year_2025.day_04 import solution as day_04
+
+
+EXAMPLE = "\n".join(
+    [
+        "..@@.@@@@.",
+        "@@@.@.@.@@",
+        "@@@@@.@.@@",
+        "@.@@@@..@.",
+        "@@.@@@@.@@",
+        ".@@@@@@@.@",
+        ".@.@.@.@@@",
+        "@.@@@.@@@@",
+        ".@@@@@@@@.",
+        "@.@.@@@.@.",
+    ]
+)
+
+
+def random_rolls(rng: random.Random) -> np.ndarray:
+    """Make a random grid of rolls, dense enough that removal takes many rounds."""
+    shape = (rng.randint(1, 30), rng.randint(1, 30))
+    density = rng.uniform(0.3, 0.9)
+    return np.random.default_rng(rng.randint(0, 2**32)).random(shape) < density
+
+
+def test_example() -> None:
+    assert day_04.solve(EXAMPLE) == (13, 43)
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_peeling_matches_rounds(seed: int) -> None:
+    rolls = random_rolls(random.Random(seed))
+    counts = neighbour_counts(rolls)
+
+    # The kernel is only compiled with AOC_JIT=1, so run it interpreted on arrays
+    peeled = day_04.peel_rolls.func(rolls, counts)
+
+    assert peeled == day_04.remove_in_rounds(rolls, counts)
+    text = "\n".join("".join("@" if roll else "." for roll in row) for row in rolls)
+    assert peeled == oracles.removable_rolls(text)
+
+
+@pytest.fixture(scope="module")
+def compiled_peel_rolls() -> Callable[[np.ndarray, np.ndarray], int]:
+    numba = pytest.importorskip("numba")
+    return numba.njit(day_04.peel_rolls.func)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_compiled_peeling_matches_rounds(
+    seed: int, compiled_peel_rolls: Callable[[np.ndarray, np.ndarray], int]
+) -> None:
+    rolls = random_rolls(random.Random(seed))
+    counts = neighbour_counts(rolls)
+
+    assert compiled_peel_rolls(rolls, counts) == day_04.remove_in_rounds(rolls, counts)
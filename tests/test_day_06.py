@@ -0,0 +1,97 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from advent_of_code.year_2025.day_06 import solution as day_06
+
+
+EXAMPLE = "123 328  51 64 \n 45 64  387 23 \n  6 98  215 314\n*   +   *   +  "
+
+
+def test_example() -> None:
+    assert day_06.solve(EXAMPLE) == (4277556, 3263827)
+
+
+def test_row_operands_wider_than_int64() -> None:
+    input_data = "\n".join(
+        ["12345678901234567890 1", "1                    1", "*                    +"]
+    )
+
+    assert day_06.solve(input_data) == (12345678901234567892, 11)
+
+
+def test_column_operands_taller_than_int64() -> None:
+    digits = "12345678912345678912"
+    input_data = "\n".join([*digits, "*"])
+
+    part1, part2 = day_06.solve(input_data)
+
+    assert part1 == day_06.product_tree([int(digit) for digit in digits])
+    assert part2 == int(digits)
+
+
+def test_int64_sized_operands_stay_exact() -> None:
+    widest = "9" * day_06.MAX_INT64_DIGITS
+    input_data = f"{widest} 1\n{widest} 2\n*{' ' * len(widest)}+"
+
+    assert day_06.solve(input_data)[0] == int(widest) ** 2 + 3
+
+
+def test_narrow_operands_stay_vectorized(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(*_: object) -> int:
+        msg = "Only operands wider than int64 are read one by one"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(day_06.Worksheet, "_exact_number", staticmethod(fail))
+    rng = random.Random(6)
+    # Far more digits across each row than int64 holds, but few in any problem
+    input_data = random_worksheet(rng, 500)
+    worksheet = day_06.parse(input_data)
+
+    rows, columns = worksheet.row_numbers(), worksheet.column_numbers()
+
+    assert len(rows) == len(columns) == 500
+    assert max(max(operands) for operands in rows + columns) < 10**4
+    assert worksheet.is_digit.sum(axis=1).min() > day_06.MAX_INT64_DIGITS
+
+
+def random_worksheet(rng: random.Random, problems: int) -> str:
+    """Make a worksheet of problems with ragged operands and widths.
+
+    The widest operand of each problem fills its block, so no column inside a
+    problem is blank.
+    """
+    rows = rng.randint(1, 4)
+    blocks = []
+    for _ in range(problems):
+        width = rng.randint(1, 4)
+        operands = [str(rng.randint(10 ** (width - 1), 10**width - 1))]
+        for _ in range(rows - 1):
+            operand = str(rng.randint(1, 10**width - 1))
+            operands.append(
+                operand.rjust(width) if rng.random() < 0.5 else operand.ljust(width)
+            )
+        rng.shuffle(operands)
+        blocks.append([*operands, rng.choice("+*").ljust(width)])
+    return "\n".join(
+        " ".join(block[row] for block in blocks).rstrip() for row in range(rows + 1)
+    )
+
+
+@pytest.mark.parametrize("window", [1, 2, 3, 7, day_06.STREAM_WINDOW])
+@pytest.mark.parametrize("seed", range(20))
+def test_stream_solve_matches_solve(tmp_path: Path, seed: int, window: int) -> None:
+    rng = random.Random(seed)
+    input_data = random_worksheet(rng, rng.randint(1, 40))
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(input_data + "\n")
+
+    assert day_06.stream_solve(input_file, window=window) == day_06.solve(input_data)
+
+
+def test_stream_solve_empty_file(tmp_path: Path) -> None:
+    input_file = tmp_path / "input.txt"
+    input_file.touch()
+
+    assert day_06.stream_solve(input_file) == (0, 0)
@@ -0,0 +1,8 @@
+import pytest
+
+from advent_of_code.fuzz import DEFAULT_SEED, ENGINES, Engine, fuzz_engine
+
+
+@pytest.mark.parametrize("engine", ENGINES, ids=lambda engine: engine.name)
+def test_optimized_paths_match_oracles(engine: Engine) -> None:
+    assert fuzz_engine(engine, [4, 8, 16], trials=2, seed=DEFAULT_SEED) == []
@@ -0,0 +1,93 @@
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from advent_of_code.lib import IntervalSet
+from advent_of_code.year_2025.day_05 import solution as day_05
+
+
+def brute_force_union(pairs: list[tuple[int, int]]) -> set[int]:
+    """Collect every integer covered by the inclusive ranges."""
+    return {value for start, end in pairs for value in range(start, end + 1)}
+
+
+def random_pairs(rng: random.Random, count: int) -> list[tuple[int, int]]:
+    """Make ranges that often nest inside, touch or overlap earlier ones."""
+    pairs: list[tuple[int, int]] = []
+    for _ in range(count):
+        if pairs and rng.random() < 0.5:
+            start, end = rng.choice(pairs)
+            shape = rng.choice(["nested", "adjacent", "overlapping"])
+            if shape == "nested":
+                inner_start = rng.randint(start, end)
+                pairs.append((inner_start, rng.randint(inner_start, end)))
+            elif shape == "adjacent":
+                pairs.append((end + 1, end + 1 + rng.randint(0, 10)))
+            else:
+                pairs.append((rng.randint(start, end), end + rng.randint(0, 10)))
+        else:
+            start = rng.randint(0, 200)
+            pairs.append((start, start + rng.randint(0, 20)))
+    return pairs
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_matches_brute_force_union(seed: int) -> None:
+    rng = random.Random(seed)
+    pairs = random_pairs(rng, rng.randint(1, 30))
+    union = brute_force_union(pairs)
+
+    interval_set = IntervalSet.from_pairs(np.array(pairs))
+
+    assert len(interval_set) == len(union)
+    covered = brute_force_union(interval_set.intervals)
+    assert covered == union
+    probes = np.arange(-5, 260)
+    assert interval_set.contains(probes).tolist() == [
+        int(probe) in union for probe in probes
+    ]
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_intervals_are_sorted_and_disjoint(seed: int) -> None:
+    rng = random.Random(seed)
+    interval_set = IntervalSet.from_pairs(np.array(random_pairs(rng, 30)))
+
+    intervals = interval_set.intervals
+    for (_, end), (next_start, _) in itertools.pairwise(intervals):
+        # Adjacent ranges are merged, so a gap of at least one always remains
+        assert next_start > end + 1
+
+
+def test_empty() -> None:
+    interval_set = IntervalSet.from_pairs(np.empty((0, 2), dtype=np.int64))
+
+    assert len(interval_set) == 0
+    assert interval_set.intervals == []
+    assert 0 not in interval_set
+
+
+def test_nested_range_does_not_shrink_union() -> None:
+    interval_set = IntervalSet.from_pairs(np.array([(1, 10), (2, 3), (5, 12)]))
+
+    assert interval_set.intervals == [(1, 12)]
+
+
+def test_adjacent_ranges_merge() -> None:
+    interval_set = IntervalSet.from_pairs(np.array([(5, 7), (1, 4), (8, 8)]))
+
+    assert interval_set.intervals == [(1, 8)]
+    assert len(interval_set) == 8
+
+
+def test_rejects_reversed_range() -> None:
+    with pytest.raises(ValueError, match="end at or after its start"):
+        IntervalSet.from_pairs(np.array([(5, 4)]))
+
+
+def test_day_05_example() -> None:
+    input_data = "3-5\n10-14\n16-20\n12-18\n\n1\n5\n8\n11\n17\n32"
+
+    assert day_05.solve(input_data) == (3, 14)
@@ -0,0 +1,74 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from advent_of_code.isolation import ResourceLimits, RunStatus, run_isolated
+
+
+HANGING_SOLUTION = """
+import os
+from pathlib import Path
+
+
+def parse(input_data):
+    return input_data
+
+
+def _hang(pid_dir):
+    (Path(pid_dir) / str(os.getpid())).touch()
+    while True:
+        pass
+
+
+def part1(pid_dir):
+    _hang(pid_dir)
+
+
+def part2(pid_dir):
+    _hang(pid_dir)
+"""
+
+
+def is_running(pid: int) -> bool:
+    """Indicate whether a process exists and is not a zombie."""
+    try:
+        status = Path(f"/proc/{pid}/status").read_text()
+    except FileNotFoundError:
+        return False
+    return "State:\tZ" not in status
+
+
+@pytest.mark.skipif(not Path("/proc").is_dir(), reason="Needs /proc")
+def test_timeout_kills_process_pool_workers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "hanging_solution.py").write_text(HANGING_SOLUTION)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    pid_dir = tmp_path / "pids"
+    pid_dir.mkdir()
+
+    run = run_isolated(
+        "hanging_solution", str(pid_dir), ResourceLimits(timeout=3), "process"
+    )
+
+    assert run.status == RunStatus.TIMEOUT
+    worker_pids = [int(path.name) for path in pid_dir.iterdir()]
+    assert len(worker_pids) == 2
+    assert os.getpid() not in worker_pids
+    deadline = time.monotonic() + 5
+    while any(map(is_running, worker_pids)) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not any(map(is_running, worker_pids))
+
+
+def test_reports_answers() -> None:
+    run = run_isolated(
+        "advent_of_code.year_2025.day_05.solution",
+        "3-5\n10-14\n16-20\n12-18\n\n1\n5\n8\n11\n17\n32",
+        ResourceLimits(timeout=60),
+    )
+
+    assert run.status == RunStatus.OK
+    assert run.result == (3, 14)
@@ -0,0 +1,67 @@
+import logging
+import time
+
+import pytest
+
+from advent_of_code.lib import jit
+from advent_of_code.parts import run_parts
+from advent_of_code.timings import record_part_timings
+from advent_of_code.year_2025.day_03 import solution as day_03
+
+
+BUSY_SECONDS = 0.2
+BANKS = "987654321111111\n811111111111119\n234234234234278\n818181911112111"
+
+
+def parse(input_data: str) -> str:
+    return input_data
+
+
+def busy_part(parsed: str) -> int:
+    """Spin on the CPU, so the part's CPU time matches its wall time."""
+    deadline = time.perf_counter() + BUSY_SECONDS
+    while time.perf_counter() < deadline:
+        pass
+    return len(parsed)
+
+
+def idle_part(parsed: str) -> int:
+    """Sleep, so the part takes wall time but almost no CPU time."""
+    time.sleep(BUSY_SECONDS)
+    return len(parsed) + 1
+
+
+@pytest.mark.parametrize("concurrency", [None, "thread", "process"])
+def test_records_cpu_time_of_each_part(
+    concurrency: str | None, caplog: pytest.LogCaptureFixture
+) -> None:
+    caplog.set_level(logging.INFO)
+    with record_part_timings() as recorder:
+        result = run_parts(parse, idle_part, busy_part, "input", concurrency)
+
+    assert result == (6, 5)
+    idle, busy = recorder.timings
+    assert (idle.part, idle.answer) == (1, "6")
+    assert (busy.part, busy.answer) == (2, "5")
+    assert busy.cpu_time > BUSY_SECONDS / 2
+    assert idle.wall_time > BUSY_SECONDS / 2
+    assert idle.cpu_time < BUSY_SECONDS / 2
+
+
+def test_rejects_unknown_concurrency() -> None:
+    with pytest.raises(ValueError, match="concurrency"):
+        run_parts(parse, busy_part, idle_part, "input", "fiber")
+
+
+@pytest.mark.parametrize("concurrency", [None, "thread", "process"])
+def test_reports_kernel_backends(
+    concurrency: str | None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Numba is opt-in, so the kernels run on Python unless AOC_JIT is set
+    monkeypatch.delenv(jit.JIT_ENV, raising=False)
+    jit.reset_kernels()
+
+    result = run_parts(day_03.parse, day_03.part1, day_03.part2, BANKS, concurrency)
+
+    assert result == (357, 3121910778619)
+    assert jit.kernel_backends() == {day_03.total_max_joltage.name: jit.PYTHON_BACKEND}
@@ -0,0 +1,55 @@
+from advent_of_code.report import find_slowdowns, group_series
+from advent_of_code.timings import TimingRecord
+
+
+def history(*wall_times: float, day: int = 1) -> list[TimingRecord]:
+    """Make the chronological records of one part with these wall times."""
+    return [
+        TimingRecord(
+            timestamp=f"2025-12-{index + 1:02d}T00:00:00+00:00",
+            year=2025,
+            day=day,
+            part=1,
+            mode="CHALLENGE",
+            answer_hash="0" * 16,
+            wall_time=wall_time,
+            cpu_time=wall_time,
+            peak_rss=None,
+            git_commit=None,
+            input_size=10,
+        )
+        for index, wall_time in enumerate(wall_times)
+    ]
+
+
+def test_flags_run_over_threshold() -> None:
+    (slowdown,) = find_slowdowns(group_series(history(1.0, 1.0, 1.0, 1.3)))
+
+    assert (slowdown.day, slowdown.part, slowdown.latest) == (1, 1, 1.3)
+    assert slowdown.baseline == 1.0
+    assert slowdown.ratio == 1.3
+
+
+def test_ignores_run_within_threshold() -> None:
+    assert find_slowdowns(group_series(history(1.0, 1.0, 1.0, 1.19))) == []
+    assert find_slowdowns(group_series(history(1.0, 1.3)), threshold=0.5) == []
+
+
+def test_ignores_small_absolute_increase() -> None:
+    # Twice as slow, but by less than the minimum delta
+    assert find_slowdowns(group_series(history(0.001, 0.002))) == []
+    assert find_slowdowns(group_series(history(0.001, 0.002)), min_delta=0) != []
+
+
+def test_compares_against_median_of_window() -> None:
+    # An old slow run falls outside the window, and one outlier in it is ignored
+    records = history(5.0, 1.0, 1.0, 3.0, 1.0, 1.0, 1.1)
+
+    assert find_slowdowns(group_series(records), window=5) == []
+    assert find_slowdowns(group_series(records), window=5, threshold=0.05) != []
+
+
+def test_needs_history() -> None:
+    records = history(1.0) + history(1.0, 2.0, day=2)
+
+    assert [s.day for s in find_slowdowns(group_series(records))] == [2]
@@ -0,0 +1,191 @@
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+import requests
+
+from advent_of_code import scaffold
+
+
+INPUT_DATA = "L68\nL30\nR48\n"
+ETAG = '"day-1"'
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serve one puzzle input like the Advent of Code website."""
+
+    # Statuses to answer with before serving the input normally
+    failures: list[int] = []  # noqa: RUF012
+    # Paths answered with 404, like days that have not unlocked yet
+    missing_paths: set[str] = set()  # noqa: RUF012
+    requests_seen: list[dict[str, str]] = []  # noqa: RUF012
+    paths_seen: list[str] = []  # noqa: RUF012
+    # Seconds to hold each request, so concurrent ones overlap
+    delay = 0.0
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def do_GET(self) -> None:
+        """Answer a request for an input, counting how many are in flight."""
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+            self.requests_seen.append(dict(self.headers))
+            self.paths_seen.append(self.path)
+        try:
+            time.sleep(self.delay)
+            self._answer()
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def _answer(self) -> None:
+        """Send the input, or a failure."""
+        if self.failures or self.path in self.missing_paths:
+            status = self.failures.pop(0) if self.failures else HTTPStatus.NOT_FOUND
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.end_headers()
+            return
+        body = INPUT_DATA.encode()
+        self.send_response(HTTPStatus.OK)
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        """Keep the server quiet."""
+
+
+@pytest.fixture
+def server(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[ThreadingHTTPServer]:
+    StandInHandler.failures = []
+    StandInHandler.missing_paths = set()
+    StandInHandler.requests_seen = []
+    StandInHandler.paths_seen = []
+    StandInHandler.delay = 0.0
+    StandInHandler.max_in_flight = 0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    thread = threading.Thread(
+        target=httpd.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+
+    host, port = httpd.server_address[:2]
+    monkeypatch.setenv("AOC_BASE_URL", f"http://{host!s}:{port}")
+    monkeypatch.setenv("AOC_SESSION_TOKEN", "token")
+    monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path / "cache"))
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.mark.usefixtures("server")
+def test_downloads_and_caches() -> None:
+    assert scaffold.fetch_input_data(2025, 1) == INPUT_DATA
+
+    cache_file, meta_file = scaffold._cache_paths(2025, 1)  # noqa: SLF001
+    assert cache_file.read_text() == INPUT_DATA
+    assert json.loads(meta_file.read_text())["etag"] == ETAG
+    assert StandInHandler.requests_seen[0]["Cookie"] == "session=token"
+
+
+@pytest.mark.usefixtures("server")
+def test_revalidates_cached_input() -> None:
+    scaffold.fetch_input_data(2025, 1)
+
+    assert scaffold.fetch_input_data(2025, 1) == INPUT_DATA
+    assert StandInHandler.requests_seen[-1]["If-None-Match"] == ETAG
+
+
+@pytest.mark.usefixtures("server")
+def test_retries_transient_failures() -> None:
+    StandInHandler.failures = [HTTPStatus.SERVICE_UNAVAILABLE]
+
+    assert scaffold.fetch_input_data(2025, 1) == INPUT_DATA
+    assert len(StandInHandler.requests_seen) == 2
+
+
+@pytest.mark.usefixtures("server")
+def test_falls_back_to_cached_input_on_failure() -> None:
+    scaffold.fetch_input_data(2025, 1)
+    StandInHandler.failures = [HTTPStatus.INTERNAL_SERVER_ERROR]
+
+    # A session without retries fails at once rather than backing off
+    assert scaffold.fetch_input_data(2025, 1, requests.Session()) == INPUT_DATA
+
+
+def test_falls_back_to_cached_input_when_unreachable(
+    server: ThreadingHTTPServer,
+) -> None:
+    scaffold.fetch_input_data(2025, 1)
+    server.shutdown()
+    server.server_close()
+
+    assert scaffold.fetch_input_data(2025, 1, requests.Session()) == INPUT_DATA
+
+
+@pytest.mark.usefixtures("server")
+def test_failure_without_cached_input_raises() -> None:
+    StandInHandler.failures = [HTTPStatus.NOT_FOUND]
+
+    with pytest.raises(RuntimeError, match="404"):
+        scaffold.fetch_input_data(2025, 1)
+
+
+@pytest.mark.usefixtures("server")
+def test_cache_is_kept_per_account(monkeypatch: pytest.MonkeyPatch) -> None:
+    scaffold.fetch_input_data(2025, 1)
+    monkeypatch.setenv("AOC_SESSION_TOKEN", "another-token")
+    StandInHandler.failures = [HTTPStatus.INTERNAL_SERVER_ERROR]
+
+    # The first account's cached input must not stand in for the second's
+    with pytest.raises(RuntimeError, match="500"):
+        scaffold.fetch_input_data(2025, 1, requests.Session())
+    cache_file, _ = scaffold._cache_paths(2025, 1)  # noqa: SLF001
+    assert "another-token" not in str(cache_file)
+
+
+@pytest.mark.usefixtures("server")
+def test_scaffolds_missing_days_of_year(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sessions = []
+
+    def create_session(pool_size: int) -> requests.Session:
+        sessions.append(real_create_session(pool_size))
+        return sessions[-1]
+
+    real_create_session = scaffold.create_session
+    monkeypatch.setattr(scaffold, "create_session", create_session)
+    base_dir = tmp_path / "package"
+    (base_dir / "year_2025" / "day_03").mkdir(parents=True)
+    StandInHandler.missing_paths = {"/2025/day/12/input"}
+    StandInHandler.delay = 0.05
+
+    scaffold.scaffold_year(2025, max_workers=4, base_dir=base_dir)
+
+    year_dir = base_dir / "year_2025"
+    assert len(sessions) == 1
+    # Already scaffolded days are not fetched
+    assert "/2025/day/3/input" not in StandInHandler.paths_seen
+    assert len(StandInHandler.paths_seen) == 11
+    assert 1 < StandInHandler.max_in_flight <= 4
+    for day in [*range(1, 3), *range(4, 12)]:
+        assert (year_dir / f"day_{day:02d}" / "input.txt").read_text() == INPUT_DATA
+    # A day that has not unlocked is skipped, so a later run picks it up
+    assert not (year_dir / "day_12").exists()
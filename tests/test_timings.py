@@ -0,0 +1,79 @@
+import logging
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from advent_of_code.parts import CPU_TIME_ATTRIBUTE, PART_MESSAGES
+from advent_of_code.timings import (
+    PartTiming,
+    build_records,
+    peak_rss_since_reset,
+    read_records,
+    record_part_timings,
+    reset_peak_rss,
+    write_records,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+def test_recorder_keeps_part_lines(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.INFO)
+    with record_part_timings() as recorder:
+        logger.info("Parsed input (%.4fs)", 0.5)
+        logger.info(PART_MESSAGES[0], 42, 1.25, extra={CPU_TIME_ATTRIBUTE: 0.75})
+        logger.info("Part 2: %s", "not timed")
+        # Solutions that time themselves log the same line without the CPU time
+        logger.info("Part 2: %s (%.2fs)", "abc", 0.5)
+    logger.info(PART_MESSAGES[0], 7, 1.0)
+
+    part1, part2 = recorder.timings
+    assert (part1.part, part1.answer, part1.wall_time) == (1, "42", 1.25)
+    assert part1.cpu_time == 0.75
+    assert (part2.part, part2.answer, part2.wall_time) == (2, "abc", 0.5)
+    assert part2.cpu_time >= 0
+
+
+@pytest.mark.parametrize("suffix", [".jsonl", ".csv"])
+@pytest.mark.parametrize("rss", [123456, None])
+def test_records_round_trip(tmp_path: Path, suffix: str, rss: int | None) -> None:
+    timings = [PartTiming(1, "10", 0.25, 0.125), PartTiming(2, "20", 1.5, 1.0)]
+    records = [
+        replace(record, git_commit=commit)
+        for record, commit in zip(
+            build_records(
+                year=2025,
+                day=6,
+                mode="TEST",
+                input_data="1 2\n+ *",
+                timings=timings,
+                rss=rss,
+            ),
+            ["abc123", None],
+            strict=True,
+        )
+    ]
+    path = tmp_path / "history" / f"timings{suffix}"
+
+    write_records(path, records[:1])
+    write_records(path, records[1:])
+
+    assert read_records(path) == records
+    assert records[0].input_size == len("1 2\n+ *")
+
+
+@pytest.mark.skipif(not reset_peak_rss(), reason="Needs Linux clear_refs")
+def test_peak_rss_covers_only_since_reset() -> None:
+    block = bytearray(64 * 1024 * 1024)
+    block[::4096] = b"x" * len(block[::4096])
+    with_block = peak_rss_since_reset()
+    del block
+
+    assert reset_peak_rss()
+    without_block = peak_rss_since_reset()
+
+    assert with_block is not None
+    assert without_block is not None
+    assert with_block - without_block > 32 * 1024 * 1024